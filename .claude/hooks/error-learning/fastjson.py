@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Fast JSON Module
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+Output is always returned as str so callers can write it to text streams.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str (bytes avoid a decode step with orjson)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj compactly, or with 2-space indentation if indent is set."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
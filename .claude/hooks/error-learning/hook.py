@@ -11,15 +11,18 @@ import sys
 import os
 import re
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
-# Import local modules
+# Import local modules. recovery, fastjson and datetime are imported where
+# used: most prompts find no errors and never need them.
 sys.path.insert(0, str(Path(__file__).parent))
-from recovery import analyze_recovery
+from prefilter import combined_literals, may_match
 
 
+@lru_cache(maxsize=1)
 def load_patterns() -> list[dict]:
-    """Load error patterns from config."""
+    """Load error patterns from config (cached - do not mutate the result)."""
     config_path = Path(__file__).parent / 'patterns.json'
     if config_path.exists():
         with open(config_path, 'r') as f:
@@ -28,86 +31,182 @@ def load_patterns() -> list[dict]:
     return []
 
 
-def load_transcript(transcript_path: str) -> str:
-    """Load transcript file content."""
-    if not Path(transcript_path).exists():
-        return ""
+def combine_patterns(
+    patterns: list[dict]
+) -> tuple[re.Pattern, dict[str, dict], Optional[tuple[str, ...]]]:
+    """
+    Compile all error patterns into a single alternation regex.
+
+    Each pattern becomes a named group p0..pN. Every alternative is anchored
+    to a line start ('^' in MULTILINE mode) followed by a lazy '.*?', so when
+    run with finditer() over newline-joined lines there is at most one match
+    per line, and alternatives are tried in config order - the first
+    configured pattern that matches anywhere in the line wins, same as
+    checking the patterns one by one.
+
+    Returns:
+        (combined regex, mapping of group name -> pattern dict,
+         lowercase literals one of which any match requires, or None)
+    """
+    combined = re.compile(
+        '^(?:' + '|'.join(f".*?(?P<p{i}>{p['pattern']})" for i, p in enumerate(patterns)) + ')',
+        re.IGNORECASE | re.MULTILINE
+    )
+    id_map = {f'p{i}': p for i, p in enumerate(patterns)}
+    literals = combined_literals([p['pattern'] for p in patterns])
+    return combined, id_map, literals
+
+
+def load_transcript(transcript_path: str) -> list[str]:
+    """Load transcript file as a list of lines."""
+    path = Path(transcript_path)
+    if not path.exists():
+        return []
+
+    return path.read_text(encoding='utf-8').splitlines()
+
+
+USER_PROMPT_MARKERS = ('<|user|>', 'human:', 'user:')
+
+
+def find_last_user_prompts(lower_lines: list[str]) -> tuple[int, int]:
+    """
+    Find the last two user prompts in (already lowercased) transcript lines.
+
+    Joins the lines once and searches backwards with str.rfind, so the scan
+    runs in C rather than as a Python loop over every line.
+
+    Returns:
+        (second-to-last prompt index, last prompt index), 0 when not found
+    """
+    text = '\n'.join(lower_lines)
+
+    positions = [text.rfind(marker) for marker in USER_PROMPT_MARKERS]
+    last_pos = max(positions)
+    if last_pos == -1:
+        return 0, 0
 
-    with open(transcript_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    # A marker absent from the whole text can't be in the prefix either -
+    # skip it rather than rescanning everything
+    present = [m for m, pos in zip(USER_PROMPT_MARKERS, positions) if pos != -1]
 
+    # Markers never span lines, so the previous prompt must end before this line
+    line_start = text.rfind('\n', 0, last_pos) + 1
+    prev_pos = max(text.rfind(marker, 0, line_start) for marker in present)
 
-def find_last_user_prompt_index(lines: list[str]) -> int:
-    """Find the index of the last user prompt in transcript."""
-    for i in range(len(lines) - 1, -1, -1):
-        line = lines[i].lower()
-        if '<|user|>' in line or 'human:' in line or 'user:' in line:
-            return i
-    return 0
+    if prev_pos == -1:
+        return 0, text.count('\n', 0, last_pos)
 
+    prev_user_idx = text.count('\n', 0, prev_pos)
+    last_user_idx = prev_user_idx + text.count('\n', prev_pos, last_pos)
+    return prev_user_idx, last_user_idx
 
-def scan_for_errors(transcript: str, patterns: list[dict]) -> list[dict]:
+
+def build_context(lines: list[str], start: int, end: int, limit: int) -> str:
+    """
+    Join lines[start:end] with newlines, truncated to limit characters.
+
+    Stops collecting once the limit is reached so long lines past it are
+    never joined.
+    """
+    parts = []
+    total = 0
+    for j in range(start, end):
+        parts.append(lines[j])
+        total += len(lines[j]) + 1
+        if total > limit:
+            break
+    return '\n'.join(parts)[:limit]
+
+
+def scan_for_errors(
+    lines: list[str],
+    patterns: list[dict],
+    lower_lines: Optional[list[str]] = None
+) -> list[dict]:
     """
     Scan transcript for error patterns since last user prompt.
 
+    lower_lines is the lowercased copy of lines; computed here if not given.
+
     Returns list of detected errors with:
     - type: error pattern ID
     - line_idx: line number in transcript
     - message: the error message
     - context: surrounding lines
     """
-    lines = transcript.split('\n')
-    last_user_idx = find_last_user_prompt_index(lines)
+    # Lowercase once; marker checks and the prefilter all reuse this
+    if lower_lines is None:
+        lower_lines = [line.lower() for line in lines]
 
     # Only scan from second-to-last user prompt to last user prompt
     # (errors that happened in the previous turn)
-    prev_user_idx = 0
-    user_count = 0
-    for i in range(len(lines) - 1, -1, -1):
-        line = lines[i].lower()
-        if '<|user|>' in line or 'human:' in line or 'user:' in line:
-            user_count += 1
-            if user_count == 2:
-                prev_user_idx = i
-                break
+    prev_user_idx, last_user_idx = find_last_user_prompts(lower_lines)
 
     search_window = lines[prev_user_idx:last_user_idx]
+    combined, id_map, literals = combine_patterns(patterns)
     errors = []
 
-    for i, line in enumerate(search_window):
-        for pattern in patterns:
-            if re.search(pattern['pattern'], line, re.IGNORECASE):
-                # Get context (3 lines before and after)
-                start = max(0, i - 3)
-                end = min(len(search_window), i + 4)
-                context = '\n'.join(search_window[start:end])
-
-                errors.append({
-                    'type': pattern['id'],
-                    'severity': pattern.get('severity', 'medium'),
-                    'line_idx': prev_user_idx + i,
-                    'message': line.strip()[:200],  # Truncate long lines
-                    'context': context[:500],  # Limit context size
-                    'suggestion_target': pattern.get('suggestion_target', 'claudemd'),
-                    'suggestion_template': pattern.get('suggestion_template', '')
-                })
-                break  # One pattern per line
+    # Cheap substring check picks candidate lines before the regex runs
+    candidates = [
+        i for i in range(len(search_window))
+        if may_match(lower_lines[prev_user_idx + i], literals)
+    ]
+    if not candidates:
+        return errors
+
+    # One regex sweep over all candidate lines instead of a call per line
+    block = '\n'.join(search_window[i] for i in candidates)
+    block_line = 0
+    block_pos = 0
+
+    for match in combined.finditer(block):
+        # Map the match offset back to its line, counting incrementally
+        block_line += block.count('\n', block_pos, match.start())
+        block_pos = match.start()
+        i = candidates[block_line]
+        line = search_window[i]
+
+        # One pattern per line - the first configured pattern that matched
+        pattern = id_map[match.lastgroup]
+
+        # Get context (3 lines before and after)
+        start = max(0, i - 3)
+        end = min(len(search_window), i + 4)
+        context = build_context(search_window, start, end, 500)  # Limit context size
+
+        errors.append({
+            'type': pattern['id'],
+            'severity': pattern.get('severity', 'medium'),
+            'line_idx': prev_user_idx + i,
+            'message': line[:200].strip(),  # Truncate long lines before stripping
+            'context': context,
+            'suggestion_target': pattern.get('suggestion_target', 'claudemd'),
+            'suggestion_template': pattern.get('suggestion_template', '')
+        })
 
     return errors
 
 
 def filter_recovered_errors(
     errors: list[dict],
-    transcript_lines: list[str]
+    transcript_lines: list[str],
+    lower_lines: Optional[list[str]] = None
 ) -> list[dict]:
     """Filter to only errors that were recovered from."""
+    from recovery import analyze_recovery
+
+    if lower_lines is None:
+        lower_lines = [line.lower() for line in transcript_lines]
+
     recovered = []
 
     for error in errors:
         result = analyze_recovery(
             error['line_idx'],
             error['type'],
-            transcript_lines
+            transcript_lines,
+            lower_lines
         )
 
         if result.is_recovered:
@@ -143,29 +242,42 @@ def calculate_impact_score(error: dict) -> float:
 
 def log_errors(errors: list[dict], session_id: str) -> None:
     """Append errors to the learning log."""
+    from datetime import datetime
+    import fastjson
+
     log_dir = Path.home() / '.claude' / 'logs'
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_file = log_dir / 'error-learning.jsonl'
 
-    with open(log_file, 'a', encoding='utf-8') as f:
-        for error in errors:
-            entry = {
-                'session_id': session_id,
-                'timestamp': datetime.now().isoformat(),
-                'error_type': error['type'],
-                'severity': error.get('severity', 'medium'),
-                'message': error['message'],
-                'context': error.get('context', ''),
-                'is_recovered': error.get('is_recovered', False),
-                'recovery_method': error.get('recovery_method'),
-                'recovery_confidence': error.get('recovery_confidence'),
-                'fix_applied': error.get('fix_applied'),
-                'impact_score': calculate_impact_score(error),
-                'suggestion_target': error.get('suggestion_target'),
-                'suggestion_template': error.get('suggestion_template')
-            }
-            f.write(json.dumps(entry) + '\n')
+    # All errors from one hook run share a timestamp
+    timestamp = datetime.now().isoformat()
+    entries = []
+
+    for error in errors:
+        entry = {
+            'session_id': session_id,
+            'timestamp': timestamp,
+            'error_type': error['type'],
+            'severity': error.get('severity', 'medium'),
+            'message': error['message'],
+            'context': error.get('context', ''),
+            'is_recovered': error.get('is_recovered', False),
+            'recovery_method': error.get('recovery_method'),
+            'recovery_confidence': error.get('recovery_confidence'),
+            'fix_applied': error.get('fix_applied'),
+            'impact_score': calculate_impact_score(error),
+            'suggestion_target': error.get('suggestion_target'),
+            'suggestion_template': error.get('suggestion_template')
+        }
+        entries.append(fastjson.dumps(entry))
+
+    if not entries:
+        return
+
+    # Single buffered write for the whole batch
+    with open(log_file, 'a', encoding='utf-8', buffering=64 * 1024) as f:
+        f.write('\n'.join(entries) + '\n')
 
 
 def main():
@@ -184,10 +296,11 @@ def main():
         if not transcript_path:
             sys.exit(0)
 
-        # Load transcript
-        transcript = load_transcript(transcript_path)
-        if not transcript:
+        # Load transcript (split into lines once, shared by every stage)
+        transcript_lines = load_transcript(transcript_path)
+        if not transcript_lines:
             sys.exit(0)
+        lower_lines = [line.lower() for line in transcript_lines]
 
         # Load patterns
         patterns = load_patterns()
@@ -195,14 +308,13 @@ def main():
             sys.exit(0)
 
         # Scan for errors
-        errors = scan_for_errors(transcript, patterns)
+        errors = scan_for_errors(transcript_lines, patterns, lower_lines)
 
         if not errors:
             sys.exit(0)
 
         # Filter to only recovered errors
-        transcript_lines = transcript.split('\n')
-        recovered_errors = filter_recovered_errors(errors, transcript_lines)
+        recovered_errors = filter_recovered_errors(errors, transcript_lines, lower_lines)
 
         if recovered_errors:
             # Log for learning
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Literal Prefilter Module
+
+Derives plain substrings that a regex cannot match without, so hot scan
+loops can skip the regex engine with a cheap `literal in line` check.
+"""
+
+from typing import Optional
+
+# Characters that end a literal run inside a regex branch
+REGEX_META = set('.^$*+?{}[]()|\\')
+QUANTIFIERS = set('*+?{')
+
+
+def branch_literal(branch: str) -> Optional[str]:
+    """
+    Return the longest literal run a single regex branch requires.
+
+    A character followed by a quantifier is optional, so it is dropped
+    from the run before it. The contents of a {m,n} quantifier are counts,
+    not text, so they are skipped. Returns None if no usable literal exists.
+    """
+    runs = []
+    current = ''
+    in_braces = False
+
+    for char in branch:
+        if in_braces:
+            in_braces = char != '}'
+        elif char in REGEX_META:
+            in_braces = char == '{'
+            if char in QUANTIFIERS and current:
+                current = current[:-1]
+            runs.append(current)
+            current = ''
+        else:
+            current += char
+    runs.append(current)
+
+    longest = max(runs, key=len)
+    return longest.lower() if longest.strip() else None
+
+
+def required_literals(pattern: str) -> Optional[tuple[str, ...]]:
+    """
+    Derive lowercase substrings, one of which must appear for a match.
+
+    Only handles flat alternations (no groups, classes or escapes); anything
+    more complex returns None, meaning the pattern cannot be prefiltered.
+    """
+    if any(char in pattern for char in '()[]\\'):
+        return None
+
+    literals = []
+    for branch in pattern.split('|'):
+        literal = branch_literal(branch)
+        if literal is None:
+            return None
+        literals.append(literal)
+
+    return tuple(literals)
+
+
+def combined_literals(patterns: list[str]) -> Optional[tuple[str, ...]]:
+    """Union of required literals for a set of patterns (None if any is unfilterable)."""
+    literals = []
+    for pattern in patterns:
+        derived = required_literals(pattern)
+        if derived is None:
+            return None
+        literals.extend(derived)
+
+    return tuple(dict.fromkeys(literals))
+
+
+def may_match(lower_line: str, literals: Optional[tuple[str, ...]]) -> bool:
+    """Check whether a lowercased line could match, given its prefilter literals."""
+    if literals is None:
+        return True
+    return any(literal in lower_line for literal in literals)
@@ -11,12 +11,13 @@ Detects when errors were successfully recovered from using multiple signals:
 import re
 import json
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+from prefilter import combined_literals, may_match
 
-@dataclass
-class RecoveryResult:
+
+class RecoveryResult(NamedTuple):
     """Result of recovery detection analysis."""
     is_recovered: bool
     method: Optional[str]  # 'success_after_failure', 'self_correction', 'task_completion'
@@ -24,8 +25,9 @@ class RecoveryResult:
     fix_applied: Optional[str]  # What action fixed the error
 
 
+@lru_cache(maxsize=1)
 def load_recovery_config() -> dict:
-    """Load recovery signal configuration."""
+    """Load recovery signal configuration (cached - do not mutate the result)."""
     config_path = Path(__file__).parent / 'patterns.json'
     if config_path.exists():
         with open(config_path, 'r') as f:
@@ -34,10 +36,84 @@ def load_recovery_config() -> dict:
     return {}
 
 
+# Map error types to success patterns
+SUCCESS_PATTERNS = {
+    'file_not_found': [
+        r'File.*read successfully',
+        r'successfully read',
+        r'<file_contents>',
+    ],
+    'permission_denied': [
+        r'successfully.*wrote',
+        r'File created successfully',
+        r'completed successfully',
+    ],
+    'edit_before_read': [
+        r'<file_contents>',  # Read happened
+        r'has been updated',  # Then edit succeeded
+    ],
+    'command_not_found': [
+        r'Tool ran without output or errors',
+        r'exit code 0',
+    ],
+}
+DEFAULT_SUCCESS_PATTERNS = [r'successfully', r'completed']
+
+DEFAULT_CORRECTION_PATTERNS = [
+    'let me try',
+    'instead I\'ll',
+    'let me use',
+    'I\'ll try a different',
+    'let me read.*first',
+    'I should read',
+    'I need to read',
+]
+
+COMPLETION_PATTERNS = [
+    r'task.*complete',
+    r'successfully.*implemented',
+    r'changes.*applied',
+    r'done!',
+    r'finished',
+    r'all.*complete',
+    r'created.*successfully',
+    r'updated.*successfully',
+]
+
+
+def _compile_all(patterns: list[str]) -> tuple[re.Pattern, ...]:
+    """Compile case-insensitive patterns once at import time."""
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+_SUCCESS_RES = {
+    error_type: _compile_all(patterns)
+    for error_type, patterns in SUCCESS_PATTERNS.items()
+}
+_SUCCESS_LITERALS = {
+    error_type: combined_literals(patterns)
+    for error_type, patterns in SUCCESS_PATTERNS.items()
+}
+_DEFAULT_SUCCESS_RES = _compile_all(DEFAULT_SUCCESS_PATTERNS)
+_DEFAULT_SUCCESS_LITERALS = combined_literals(DEFAULT_SUCCESS_PATTERNS)
+
+_CORRECTION_PATTERNS = (
+    load_recovery_config()
+    .get('self_correction_language', {})
+    .get('patterns', DEFAULT_CORRECTION_PATTERNS)
+)
+_CORRECTION_RES = _compile_all(_CORRECTION_PATTERNS)
+_CORRECTION_LITERALS = combined_literals(_CORRECTION_PATTERNS)
+
+_COMPLETION_RES = _compile_all(COMPLETION_PATTERNS)
+_COMPLETION_LITERALS = combined_literals(COMPLETION_PATTERNS)
+
+
 def detect_success_after_failure(
     error_line_idx: int,
     error_type: str,
-    transcript_lines: list[str]
+    transcript_lines: list[str],
+    lower_lines: list[str]
 ) -> Optional[RecoveryResult]:
     """
     Detect if the same operation succeeded after failing.
@@ -47,41 +123,23 @@ def detect_success_after_failure(
     - File read success after file not found
     - Command success after command failure
     """
-    # Map error types to success patterns
-    success_patterns = {
-        'file_not_found': [
-            r'File.*read successfully',
-            r'successfully read',
-            r'<file_contents>',
-        ],
-        'permission_denied': [
-            r'successfully.*wrote',
-            r'File created successfully',
-            r'completed successfully',
-        ],
-        'edit_before_read': [
-            r'<file_contents>',  # Read happened
-            r'has been updated',  # Then edit succeeded
-        ],
-        'command_not_found': [
-            r'Tool ran without output or errors',
-            r'exit code 0',
-        ],
-    }
-
-    patterns = success_patterns.get(error_type, [r'successfully', r'completed'])
+    patterns = _SUCCESS_RES.get(error_type, _DEFAULT_SUCCESS_RES)
+    literals = _SUCCESS_LITERALS.get(error_type, _DEFAULT_SUCCESS_LITERALS)
 
     # Look in lines after the error
-    search_window = transcript_lines[error_line_idx + 1:error_line_idx + 50]
+    end = min(error_line_idx + 50, len(transcript_lines))
 
-    for i, line in enumerate(search_window):
+    for i in range(error_line_idx + 1, end):
+        if not may_match(lower_lines[i], literals):
+            continue
+        line = transcript_lines[i]
         for pattern in patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+            if pattern.search(line):
                 return RecoveryResult(
                     is_recovered=True,
                     method='success_after_failure',
                     confidence=0.8,
-                    fix_applied=f"Operation succeeded on retry (line +{i+1})"
+                    fix_applied=f"Operation succeeded on retry (line +{i - error_line_idx})"
                 )
 
     return None
@@ -89,7 +147,8 @@ def detect_success_after_failure(
 
 def detect_self_correction(
     error_line_idx: int,
-    transcript_lines: list[str]
+    transcript_lines: list[str],
+    lower_lines: list[str]
 ) -> Optional[RecoveryResult]:
     """
     Detect if Claude used self-correction language after the error.
@@ -99,23 +158,15 @@ def detect_self_correction(
     - "instead I'll..."
     - "I should read first"
     """
-    config = load_recovery_config()
-    correction_patterns = config.get('self_correction_language', {}).get('patterns', [
-        'let me try',
-        'instead I\'ll',
-        'let me use',
-        'I\'ll try a different',
-        'let me read.*first',
-        'I should read',
-        'I need to read',
-    ])
-
     # Look in lines after the error (Claude's response)
-    search_window = transcript_lines[error_line_idx + 1:error_line_idx + 20]
-
-    for i, line in enumerate(search_window):
-        for pattern in correction_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+    end = min(error_line_idx + 20, len(transcript_lines))
+
+    for i in range(error_line_idx + 1, end):
+        if not may_match(lower_lines[i], _CORRECTION_LITERALS):
+            continue
+        line = transcript_lines[i]
+        for pattern in _CORRECTION_RES:
+            if pattern.search(line):
                 # Extract what action was taken
                 fix_applied = line.strip()[:100]  # First 100 chars
                 return RecoveryResult(
@@ -130,7 +181,8 @@ def detect_self_correction(
 
 def detect_task_completion(
     error_line_idx: int,
-    transcript_lines: list[str]
+    transcript_lines: list[str],
+    lower_lines: list[str]
 ) -> Optional[RecoveryResult]:
     """
     Detect if the overall task completed despite the error.
@@ -140,23 +192,15 @@ def detect_task_completion(
     - User satisfaction signals
     - Successful output delivery
     """
-    completion_patterns = [
-        r'task.*complete',
-        r'successfully.*implemented',
-        r'changes.*applied',
-        r'done!',
-        r'finished',
-        r'all.*complete',
-        r'created.*successfully',
-        r'updated.*successfully',
-    ]
-
-    # Look towards end of transcript (task completion usually at end)
-    search_window = transcript_lines[error_line_idx + 1:]
-
-    for i, line in enumerate(search_window):
-        for pattern in completion_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+    # Task completion is usually at the end of the transcript, and the result
+    # doesn't depend on which line matched, so scan backwards from the end
+    # down to the error - usually stops within the last few lines.
+    for i in range(len(transcript_lines) - 1, error_line_idx, -1):
+        if not may_match(lower_lines[i], _COMPLETION_LITERALS):
+            continue
+        line = transcript_lines[i]
+        for pattern in _COMPLETION_RES:
+            if pattern.search(line):
                 return RecoveryResult(
                     is_recovered=True,
                     method='task_completion',
@@ -170,7 +214,8 @@ def detect_task_completion(
 def analyze_recovery(
     error_line_idx: int,
     error_type: str,
-    transcript_lines: list[str]
+    transcript_lines: list[str],
+    lower_lines: Optional[list[str]] = None
 ) -> RecoveryResult:
     """
     Analyze whether an error was recovered from using all detection methods.
@@ -178,22 +223,34 @@ def analyze_recovery(
     Combines signals with weighted confidence:
     - Success after failure: 0.4 weight
     - Self-correction: 0.3 weight
-    - Task completion: 0.3 weight
+    - Task completion: 0.3 weight (only checked when success after failure is not found)
+
+    Pass lower_lines (lowercased transcript_lines) when analyzing several
+    errors from the same transcript so it is only computed once.
     """
+    if lower_lines is None:
+        lower_lines = [line.lower() for line in transcript_lines]
+
     results = []
 
-    # Try each detection method
-    success_result = detect_success_after_failure(error_line_idx, error_type, transcript_lines)
+    # Try each detection method, highest confidence ceiling first
+    success_result = detect_success_after_failure(
+        error_line_idx, error_type, transcript_lines, lower_lines
+    )
     if success_result:
         results.append(success_result)
 
-    correction_result = detect_self_correction(error_line_idx, transcript_lines)
+    correction_result = detect_self_correction(error_line_idx, transcript_lines, lower_lines)
     if correction_result:
         results.append(correction_result)
 
-    completion_result = detect_task_completion(error_line_idx, transcript_lines)
-    if completion_result:
-        results.append(completion_result)
+    # Success after failure already decides the method, so skip the
+    # open-ended scan to the end of the transcript - it could only add
+    # a small confidence boost.
+    if not success_result:
+        completion_result = detect_task_completion(error_line_idx, transcript_lines, lower_lines)
+        if completion_result:
+            results.append(completion_result)
 
     if not results:
         return RecoveryResult(
@@ -208,7 +265,9 @@ def analyze_recovery(
 
     # Boost confidence if multiple methods agree
     if len(results) > 1:
-        best_result.confidence = min(1.0, best_result.confidence + 0.1 * (len(results) - 1))
+        best_result = best_result._replace(
+            confidence=min(1.0, best_result.confidence + 0.1 * (len(results) - 1))
+        )
 
     return best_result
 
@@ -13,13 +13,15 @@ import json
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
-from collections import Counter
+from collections import Counter, defaultdict
 
 # Import local modules
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
+import fastjson
 from suggestions import generate_suggestions, format_suggestion_for_review
 from trends import (
+    entry_timestamp,
     load_error_log,
     bucket_errors_by_day,
     generate_trend_graph,
@@ -34,46 +36,27 @@ def filter_errors(
     error_type: str = None,
     recovered_only: bool = True
 ) -> list[dict]:
-    """Filter errors by various criteria."""
-    filtered = errors
-
-    if since_date:
-        filtered = [
-            e for e in filtered
-            if datetime.fromisoformat(e['timestamp']) >= since_date
-        ]
-
-    if error_type:
-        filtered = [
-            e for e in filtered
-            if e['error_type'] == error_type
-        ]
-
-    if recovered_only:
-        filtered = [
-            e for e in filtered
-            if e.get('is_recovered', False)
-        ]
-
-    return filtered
+    """Filter errors by various criteria in a single pass."""
+    # Cheap field checks first so timestamps are only parsed for survivors
+    return [
+        e for e in errors
+        if (not error_type or e['error_type'] == error_type)
+        and (not recovered_only or e.get('is_recovered', False))
+        and (not since_date or (entry_timestamp(e) or datetime.min) >= since_date)
+    ]
 
 
 def calculate_impact_scores(errors: list[dict]) -> dict[str, float]:
     """Calculate average impact score per error type."""
-    scores = {}
-    counts = Counter()
+    # error_type -> [sum of impact scores, count], accumulated in one pass
+    totals = defaultdict(lambda: [0.0, 0])
 
     for error in errors:
-        error_type = error['error_type']
-        impact = error.get('impact_score', 0.5)
-        scores[error_type] = scores.get(error_type, 0) + impact
-        counts[error_type] += 1
-
-    # Average
-    for error_type in scores:
-        scores[error_type] /= counts[error_type]
+        total = totals[error['error_type']]
+        total[0] += error.get('impact_score', 0.5)
+        total[1] += 1
 
-    return scores
+    return {error_type: score / count for error_type, (score, count) in totals.items()}
 
 
 def generate_full_report(
@@ -119,25 +102,26 @@ def generate_full_report(
         output.append("## Recent Error Examples")
         output.append("")
 
-        # Group by type, show most recent for each
-        seen_types = set()
-        for error in reversed(errors):  # Most recent first
-            if error['error_type'] not in seen_types:
-                seen_types.add(error['error_type'])
-                output.append(f"### {error['error_type']}")
-                output.append("")
-                output.append(f"**Message**: {error['message']}")
-                output.append(f"**Recovery**: {error.get('recovery_method', 'unknown')}")
-                output.append(f"**Fix applied**: {error.get('fix_applied', 'unknown')}")
-                output.append("")
-                if error.get('context'):
-                    output.append("```")
-                    output.append(error['context'][:300])
-                    output.append("```")
-                    output.append("")
+        # Most recent error per type, ordered by when each type last occurred.
+        # Re-inserting moves a type to the end, so the dict stays recency-ordered.
+        latest_per_type: dict[str, dict] = {}
+        for error in errors:
+            latest_per_type.pop(error['error_type'], None)
+            latest_per_type[error['error_type']] = error
 
-            if len(seen_types) >= 5:  # Limit examples
-                break
+        # Five most recently seen types, most recent first
+        for error in list(latest_per_type.values())[:-6:-1]:
+            output.append(f"### {error['error_type']}")
+            output.append("")
+            output.append(f"**Message**: {error['message']}")
+            output.append(f"**Recovery**: {error.get('recovery_method', 'unknown')}")
+            output.append(f"**Fix applied**: {error.get('fix_applied', 'unknown')}")
+            output.append("")
+            if error.get('context'):
+                output.append("```")
+                output.append(error['context'][:300])
+                output.append("```")
+                output.append("")
 
     return '\n'.join(output)
 
@@ -228,7 +212,7 @@ def main():
                 for s in suggestions
             ]
         }
-        print(json.dumps(output, indent=2))
+        print(fastjson.dumps(output, indent=True))
     else:
         report = generate_full_report(
             filtered,
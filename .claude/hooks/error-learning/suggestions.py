@@ -11,6 +11,7 @@ Outputs target-specific formats:
 
 import json
 from pathlib import Path
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import Optional
 from collections import Counter
@@ -28,8 +29,9 @@ class Suggestion:
     frequency: int  # How often this error occurred
 
 
+@lru_cache(maxsize=1)
 def load_patterns() -> dict:
-    """Load pattern configuration."""
+    """Load pattern configuration (cached - do not mutate the result)."""
     config_path = Path(__file__).parent / 'patterns.json'
     if config_path.exists():
         with open(config_path, 'r') as f:
@@ -142,6 +144,10 @@ def generate_suggestions(error_counts: Counter, impact_scores: Optional[dict] =
     """
     Generate prioritized suggestions based on error frequencies.
 
+    Results are memoized on the counts and impact scores, so repeated report
+    generation from the same data skips rebuilding the suggestion content.
+    The returned Suggestion objects are shared - treat them as read-only.
+
     Args:
         error_counts: Counter of error_type -> count
         impact_scores: Optional dict of error_type -> impact score (higher = blocked task)
@@ -149,11 +155,24 @@ def generate_suggestions(error_counts: Counter, impact_scores: Optional[dict] =
     Returns:
         List of Suggestion objects, sorted by priority
     """
+    return list(_generate_suggestions_cached(
+        tuple(error_counts.items()),
+        frozenset((impact_scores or {}).items())
+    ))
+
+
+@lru_cache(maxsize=32)
+def _generate_suggestions_cached(
+    error_counts: tuple[tuple[str, int], ...],
+    impact_scores: frozenset
+) -> tuple[Suggestion, ...]:
+    """Build suggestions from hashable counts/impacts (see generate_suggestions)."""
+    impact_scores = dict(impact_scores)
     config = load_patterns()
     patterns = {p['id']: p for p in config.get('patterns', [])}
     suggestions = []
 
-    for error_type, count in error_counts.items():
+    for error_type, count in error_counts:
         if error_type not in patterns:
             continue
 
@@ -170,7 +189,7 @@ def generate_suggestions(error_counts: Counter, impact_scores: Optional[dict] =
             continue
 
         # Adjust priority based on impact if provided
-        if impact_scores and error_type in impact_scores:
+        if error_type in impact_scores:
             # Lower priority number = higher priority
             # High impact errors get boosted
             impact = impact_scores[error_type]
@@ -182,7 +201,7 @@ def generate_suggestions(error_counts: Counter, impact_scores: Optional[dict] =
     # Sort by priority (lower first), then by frequency (higher first)
     suggestions.sort(key=lambda s: (s.priority, -s.frequency))
 
-    return suggestions
+    return tuple(suggestions)
 
 
 def format_suggestion_for_review(suggestion: Suggestion) -> str:
@@ -9,12 +9,13 @@ using synthetic transcript data.
 import json
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
 from collections import Counter
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from hook import load_patterns, scan_for_errors
+from prefilter import required_literals
 from recovery import analyze_recovery, RecoveryResult
 from suggestions import generate_suggestions, Suggestion
 from trends import bucket_errors_by_day, calculate_trend, generate_sparkline
@@ -68,6 +69,15 @@ TRANSCRIPT_NO_RECOVERY = [
     "Human: I see"
 ]
 
+TRANSCRIPT_SCAN_WINDOW = [
+    "Human: Parse the config",
+    "Assistant: Parsing config.json",
+    "SyntaxError: Unexpected token } in JSON at position 12",
+    "Error: No such file or directory: settings.json",
+    "Let me try a different path.",
+    "Human: Thanks!"
+]
+
 TRANSCRIPT_MULTIPLE_ERRORS = [
     "Human: Set up the project",
     "Assistant: Let me set up the project.",
@@ -148,6 +158,16 @@ def test_multiple_errors_with_recovery():
     print(f"[PASS] Multiple errors: error1={result1.is_recovered}, error2={result2.is_recovered}")
 
 
+def test_scan_for_errors():
+    """Test: Error scan keeps config order and reports one pattern per line."""
+    errors = scan_for_errors(TRANSCRIPT_SCAN_WINDOW, load_patterns())
+    found = [(e['line_idx'], e['type']) for e in errors]
+
+    # json_parse_error is listed before syntax_error in patterns.json
+    assert found == [(2, 'json_parse_error'), (3, 'file_not_found')], f"Found: {found}"
+    print(f"[PASS] Scan: {found}")
+
+
 def test_suggestion_generation():
     """Test: Suggestion generation for common error types."""
     error_counts = Counter({
@@ -170,16 +190,15 @@ def test_suggestion_generation():
 
 def test_trend_calculation():
     """Test: Trend calculation with sample data."""
-    # Create sample daily buckets
-    today = datetime.now()
+    # Create sample daily buckets, keyed by day offset (0 = today)
     buckets = {
-        (today - timedelta(days=6)).strftime('%Y-%m-%d'): Counter({'edit_before_read': 5}),
-        (today - timedelta(days=5)).strftime('%Y-%m-%d'): Counter({'edit_before_read': 4}),
-        (today - timedelta(days=4)).strftime('%Y-%m-%d'): Counter({'edit_before_read': 3}),
-        (today - timedelta(days=3)).strftime('%Y-%m-%d'): Counter({'edit_before_read': 2}),
-        (today - timedelta(days=2)).strftime('%Y-%m-%d'): Counter({'edit_before_read': 2}),
-        (today - timedelta(days=1)).strftime('%Y-%m-%d'): Counter({'edit_before_read': 1}),
-        today.strftime('%Y-%m-%d'): Counter({'edit_before_read': 1}),
+        6: Counter({'edit_before_read': 5}),
+        5: Counter({'edit_before_read': 4}),
+        4: Counter({'edit_before_read': 3}),
+        3: Counter({'edit_before_read': 2}),
+        2: Counter({'edit_before_read': 2}),
+        1: Counter({'edit_before_read': 1}),
+        0: Counter({'edit_before_read': 1}),
     }
 
     trend = calculate_trend(buckets, 'edit_before_read', days=7)
@@ -198,6 +217,19 @@ def test_sparkline_generation():
     print(f"[PASS] Sparkline: '{sparkline}'")
 
 
+def test_prefilter_counted_quantifier():
+    """Test: {m,n} quantifier counts are not taken as required literals."""
+    import re
+
+    for pattern, line in ((r'x{2,3}y', 'xxy'), (r'ab{10}', 'a' + 'b' * 10)):
+        literals = required_literals(pattern)
+        assert re.search(pattern, line), f"Fixture should match {pattern!r}"
+        assert literals is None or any(lit in line for lit in literals), \
+            f"Prefilter {literals} would skip a line matching {pattern!r}"
+
+    print(f"[PASS] Prefilter: quantifier counts skipped ({required_literals(r'x{2,3}y')})")
+
+
 def run_all_tests():
     """Run all test cases."""
     print("=" * 60)
@@ -211,9 +243,11 @@ def run_all_tests():
         test_recovery_detection_permission_denied,
         test_no_recovery,
         test_multiple_errors_with_recovery,
+        test_scan_for_errors,
         test_suggestion_generation,
         test_trend_calculation,
         test_sparkline_generation,
+        test_prefilter_counted_quantifier,
     ]
 
     passed = 0
@@ -6,76 +6,81 @@ Generates ASCII graphs and statistics showing error patterns over time.
 Helps identify whether fixes are working and which patterns are growing/shrinking.
 """
 
-import json
+import heapq
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from collections import defaultdict, Counter
-from typing import Optional
+from operator import itemgetter
+from typing import Iterable, Optional
+
+import fastjson
+
+
+def entry_timestamp(error: dict) -> Optional[datetime]:
+    """
+    Get an entry's timestamp as a datetime, parsing the ISO string at most once.
+
+    The parsed value is cached on the entry under '_ts' (None if missing/invalid).
+    """
+    if '_ts' not in error:
+        try:
+            error['_ts'] = datetime.fromisoformat(error['timestamp'])
+        except (KeyError, TypeError, ValueError):
+            error['_ts'] = None
+    return error['_ts']
 
 
 def load_error_log() -> list[dict]:
-    """Load all error entries from the log file."""
+    """Load all error entries from the log file, with timestamps pre-parsed."""
     log_file = Path.home() / '.claude' / 'logs' / 'error-learning.jsonl'
 
     if not log_file.exists():
         return []
 
     errors = []
-    with open(log_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    errors.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+    # One bulk read split in C; bytes lines go straight to the parser undecoded
+    for line in log_file.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            error = fastjson.loads(line)
+        except fastjson.JSONDecodeError:
+            continue
+        entry_timestamp(error)
+        errors.append(error)
 
     return errors
 
 
-def bucket_errors_by_day(errors: list[dict], days: int = 7) -> dict[str, Counter]:
+def bucket_errors_by_day(errors: list[dict], days: int = 7) -> dict[int, Counter]:
     """
     Group errors by day for the last N days.
 
     Returns:
-        dict mapping date string -> Counter of error types
+        dict mapping day offset (0 = today, 1 = yesterday, ...) -> Counter of error types
     """
-    cutoff = datetime.now() - timedelta(days=days)
-    buckets = defaultdict(Counter)
-
-    for error in errors:
-        try:
-            ts = datetime.fromisoformat(error['timestamp'])
-            if ts >= cutoff:
-                date_str = ts.strftime('%Y-%m-%d')
-                buckets[date_str][error['error_type']] += 1
-        except (KeyError, ValueError):
-            continue
-
-    return dict(buckets)
+    today = date.today()
 
+    # Tally (day, type) pairs in one batch - Counter counts an iterable in C
+    pair_counts = Counter(
+        (offset, error['error_type'])
+        for error in errors
+        if (ts := entry_timestamp(error)) is not None
+        and 0 <= (offset := (today - ts.date()).days) < days
+        and 'error_type' in error
+    )
 
-def calculate_trend(
-    daily_buckets: dict[str, Counter],
-    error_type: str,
-    days: int = 7
-) -> dict:
-    """
-    Calculate trend for a specific error type.
+    buckets = defaultdict(Counter)
+    for (offset, error_type), count in pair_counts.items():
+        buckets[offset][error_type] = count
 
-    Returns:
-        dict with 'direction', 'change_pct', 'values'
-    """
-    # Get values for each day
-    today = datetime.now()
-    values = []
+    return dict(buckets)
 
-    for i in range(days - 1, -1, -1):
-        date_str = (today - timedelta(days=i)).strftime('%Y-%m-%d')
-        count = daily_buckets.get(date_str, Counter()).get(error_type, 0)
-        values.append(count)
 
-    # Calculate trend direction
+@lru_cache(maxsize=256)
+def _trend_direction(values: tuple[int, ...]) -> tuple[str, float]:
+    """Compare the two halves of a series, returning (direction, change_pct)."""
     first_half = sum(values[:len(values)//2]) or 1
     second_half = sum(values[len(values)//2:])
 
@@ -89,9 +94,29 @@ def calculate_trend(
         direction = 'stable'
         change_pct = 0
 
+    return direction, round(change_pct, 1)
+
+
+def calculate_trend(
+    daily_buckets: dict[int, Counter],
+    error_type: str,
+    days: int = 7
+) -> dict:
+    """
+    Calculate trend for a specific error type.
+
+    Returns:
+        dict with 'direction', 'change_pct', 'values'
+    """
+    # Get values for each day, oldest first
+    empty = Counter()
+    values = [daily_buckets.get(offset, empty).get(error_type, 0) for offset in range(days - 1, -1, -1)]
+
+    direction, change_pct = _trend_direction(tuple(values))
+
     return {
         'direction': direction,
-        'change_pct': round(change_pct, 1),
+        'change_pct': change_pct,
         'values': values
     }
 
@@ -106,28 +131,26 @@ def generate_ascii_bar(value: int, max_value: int, width: int = 20) -> str:
     return f"[{bar}]"
 
 
+# Simple block chars for sparklines, lowest to highest
+SPARK_BLOCKS = (' ', '_', '.', '-', '=', '#')
+
+
 def generate_sparkline(values: list[int]) -> str:
     """Generate a sparkline-style ASCII trend indicator."""
     if not values:
         return ''
 
-    # Use simple block chars for sparkline
-    blocks = [' ', '_', '.', '-', '=', '#']
-
     max_val = max(values) or 1
     min_val = min(values)
     range_val = max_val - min_val or 1
+    steps = len(SPARK_BLOCKS) - 1
 
-    sparkline = ''
-    for v in values:
-        idx = int((v - min_val) / range_val * (len(blocks) - 1))
-        sparkline += blocks[idx]
-
-    return sparkline
+    # Integer floor division keeps the block index exact for counts
+    return ''.join([SPARK_BLOCKS[(v - min_val) * steps // range_val] for v in values])
 
 
 def generate_trend_graph(
-    daily_buckets: dict[str, Counter],
+    daily_buckets: dict[int, Counter],
     error_types: list[str],
     days: int = 7
 ) -> str:
@@ -149,10 +172,12 @@ def generate_trend_graph(
     output.append("=" * 30)
     output.append("")
 
-    today = datetime.now()
+    # One trend per type; the bar scale needs every total before the loop
+    trends = {et: calculate_trend(daily_buckets, et, days) for et in error_types}
+    max_total = max((sum(t['values']) for t in trends.values()), default=0) or 1
 
     for error_type in error_types:
-        trend = calculate_trend(daily_buckets, error_type, days)
+        trend = trends[error_type]
         total = sum(trend['values'])
 
         # Direction indicator
@@ -164,8 +189,6 @@ def generate_trend_graph(
             direction_str = "stable"
 
         # Bar graph
-        max_total = max(sum(calculate_trend(daily_buckets, et, days)['values'])
-                        for et in error_types) or 1
         bar = generate_ascii_bar(total, max_total)
 
         # Sparkline
@@ -180,30 +203,33 @@ def generate_trend_graph(
     return '\n'.join(output)
 
 
-def generate_summary_stats(errors: list[dict]) -> dict:
-    """Generate summary statistics."""
-    if not errors:
-        return {
-            'total': 0,
-            'recovered': 0,
-            'recovery_rate': 0,
-            'most_common': [],
-            'sessions': 0
-        }
+def generate_summary_stats(errors: Iterable[dict]) -> dict:
+    """Generate summary statistics in a single pass over the errors."""
+    total = 0
+    recovered = 0
+    error_types = []
+    session_ids = set()
 
-    total = len(errors)
-    recovered = sum(1 for e in errors if e.get('is_recovered', False))
-    recovery_rate = (recovered / total * 100) if total > 0 else 0
+    # Bound methods as locals; types are tallied afterwards by Counter in C
+    add_type = error_types.append
+    add_session = session_ids.add
+
+    for e in errors:
+        total += 1
+        if e.get('is_recovered', False):
+            recovered += 1
+        add_type(e['error_type'])
+        add_session(e.get('session_id', 'unknown'))
 
-    type_counts = Counter(e['error_type'] for e in errors)
-    sessions = len(set(e.get('session_id', 'unknown') for e in errors))
+    type_counts = Counter(error_types)
+    recovery_rate = (recovered / total * 100) if total > 0 else 0
 
     return {
         'total': total,
         'recovered': recovered,
         'recovery_rate': round(recovery_rate, 1),
-        'most_common': type_counts.most_common(5),
-        'sessions': sessions
+        'most_common': heapq.nlargest(5, type_counts.items(), key=itemgetter(1)),
+        'sessions': len(session_ids)
     }
 
 
@@ -7,6 +7,7 @@ Usage:
     python calculate-risk.py --files "file1.ts,file2.ts,file3.ts"
     python calculate-risk.py --files "file1.ts" --signals "schema_changes,security_changes"
     echo '{"files": [...], "signals": [...]}' | python calculate-risk.py --json
+    python calculate-risk.py --files "file1.ts,file2.ts" --stop-at-high  # level only
 
 Output:
     JSON with risk assessment:
@@ -21,9 +22,17 @@ Output:
 import argparse
 import json
 import os
+import re
 import sys
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # Risk signals from config (embedded for standalone execution)
 HIGH_SIGNALS = {
@@ -47,6 +56,18 @@ MODERATE_SIGNALS = {
     "performance_sensitive": {"condition": "performance-critical code paths"},
 }
 
+
+@dataclass(slots=True)
+class Signal:
+    """A detected risk signal."""
+    level: str   # "HIGH" or "MODERATE"
+    id: str
+    reason: str
+
+    def to_dict(self) -> dict:
+        return {"level": self.level, "id": self.id, "reason": self.reason}
+
+
 # File patterns that indicate risk
 RISKY_PATH_PATTERNS = {
     "HIGH": [
@@ -71,32 +92,94 @@ RISKY_PATH_PATTERNS = {
 }
 
 
-def analyze_files(files: list[str]) -> dict:
-    """Analyze file list for risk signals."""
+def build_path_matcher(patterns: list[str]):
+    """
+    Build a single-pass matcher for a list of path substrings.
+
+    Returns a function taking a lowercased path and returning the first
+    pattern *in list order* contained in it (or None). Uses an Aho-Corasick
+    automaton when pyahocorasick is installed, otherwise one compiled regex
+    whose alternatives are tried in list order.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for idx, pattern in enumerate(patterns):
+            automaton.add_word(pattern, idx)
+        automaton.make_automaton()
+
+        def match(path_lower: str) -> str | None:
+            hits = [idx for _, idx in automaton.iter(path_lower)]
+            return patterns[min(hits)] if hits else None
+
+        return match
+
+    # One named group per pattern ("migrations/" -> "p0_migrations_"). Each
+    # branch is anchored with a lazy .*? so branches win in list order,
+    # not by leftmost position in the path.
+    group_patterns = {
+        f"p{idx}_" + re.sub(r"\W", "_", pattern): pattern
+        for idx, pattern in enumerate(patterns)
+    }
+    regex = re.compile(
+        "|".join(f".*?(?P<{name}>{re.escape(pattern)})" for name, pattern in group_patterns.items()),
+        re.DOTALL
+    )
+
+    def match(path_lower: str) -> str | None:
+        m = regex.match(path_lower)
+        return group_patterns[m.lastgroup] if m else None
+
+    return match
+
+
+# Built once at import; each file path is scanned once per risk level
+HIGH_PATH_MATCHER = build_path_matcher(RISKY_PATH_PATTERNS["HIGH"])
+MODERATE_PATH_MATCHER = build_path_matcher(RISKY_PATH_PATTERNS["MODERATE"])
+
+# Signal id for each path pattern, e.g. "migrations/" -> "path_migrations"
+PATH_SIGNAL_IDS = {
+    pattern: f"path_{pattern.replace('/', '')}"
+    for patterns in RISKY_PATH_PATTERNS.values()
+    for pattern in patterns
+}
+
+
+def analyze_files(files: list[str], stop_at_high: bool = False) -> dict:
+    """
+    Analyze file list for risk signals.
+
+    With stop_at_high, returns as soon as a HIGH signal is found; any HIGH
+    already decides the risk level, so the remaining files are skipped.
+    """
     file_count = len(files)
     signals_detected = []
 
     # Check file count thresholds
     if file_count >= 10:
-        signals_detected.append(("HIGH", "file_count", f"{file_count} files affected"))
+        signals_detected.append(Signal("HIGH", "file_count", f"{file_count} files affected"))
+        if stop_at_high:
+            return {"file_count": file_count, "signals": signals_detected}
     elif file_count >= 5:
-        signals_detected.append(("MODERATE", "medium_file_count", f"{file_count} files affected"))
+        signals_detected.append(Signal("MODERATE", "medium_file_count", f"{file_count} files affected"))
+
+    # Check file paths for risky patterns (locals avoid global lookups per file)
+    match_high = HIGH_PATH_MATCHER
+    match_moderate = MODERATE_PATH_MATCHER
+    signal_ids = PATH_SIGNAL_IDS
+    append = signals_detected.append
 
-    # Check file paths for risky patterns
     for file_path in files:
         path_lower = file_path.lower()
 
-        for pattern in RISKY_PATH_PATTERNS["HIGH"]:
-            if pattern in path_lower:
-                signal_id = f"path_{pattern.replace('/', '')}"
-                signals_detected.append(("HIGH", signal_id, f"Touches {pattern}: {file_path}"))
+        pattern = match_high(path_lower)
+        if pattern:
+            append(Signal("HIGH", signal_ids[pattern], f"Touches {pattern}: {file_path}"))
+            if stop_at_high:
                 break
 
-        for pattern in RISKY_PATH_PATTERNS["MODERATE"]:
-            if pattern in path_lower:
-                signal_id = f"path_{pattern.replace('/', '')}"
-                signals_detected.append(("MODERATE", signal_id, f"Touches {pattern}: {file_path}"))
-                break
+        pattern = match_moderate(path_lower)
+        if pattern:
+            append(Signal("MODERATE", signal_ids[pattern], f"Touches {pattern}: {file_path}"))
 
     return {
         "file_count": file_count,
@@ -104,7 +187,7 @@ def analyze_files(files: list[str]) -> dict:
     }
 
 
-def analyze_explicit_signals(signals: list[str]) -> list[tuple]:
+def analyze_explicit_signals(signals: list[str]) -> list[Signal]:
     """Analyze explicitly provided signals."""
     detected = []
 
@@ -112,14 +195,18 @@ def analyze_explicit_signals(signals: list[str]) -> list[tuple]:
         signal_lower = signal.lower().strip()
 
         if signal_lower in HIGH_SIGNALS:
-            detected.append(("HIGH", signal_lower, HIGH_SIGNALS[signal_lower]["condition"]))
+            detected.append(Signal("HIGH", signal_lower, HIGH_SIGNALS[signal_lower]["condition"]))
         elif signal_lower in MODERATE_SIGNALS:
-            detected.append(("MODERATE", signal_lower, MODERATE_SIGNALS[signal_lower]["condition"]))
+            detected.append(Signal("MODERATE", signal_lower, MODERATE_SIGNALS[signal_lower]["condition"]))
 
     return detected
 
 
-def calculate_risk(files: list[str], explicit_signals: list[str] = None) -> dict:
+def calculate_risk(
+    files: list[str],
+    explicit_signals: list[str] = None,
+    stop_at_high: bool = False
+) -> dict:
     """
     Calculate overall risk level.
 
@@ -128,29 +215,30 @@ def calculate_risk(files: list[str], explicit_signals: list[str] = None) -> dict
     - 3+ MODERATE signals = HIGH risk
     - Any MODERATE signal = MODERATE risk
     - Otherwise = LOW risk
+
+    With stop_at_high, file scanning stops at the first HIGH signal. The
+    risk level is still exact, but signal counts and lists may be partial.
     """
     all_signals = []
 
     # Analyze files
-    file_analysis = analyze_files(files)
+    file_analysis = analyze_files(files, stop_at_high)
     all_signals.extend(file_analysis["signals"])
 
     # Add explicit signals
     if explicit_signals:
         all_signals.extend(analyze_explicit_signals(explicit_signals))
 
-    # Deduplicate signals
-    seen = set()
-    unique_signals = []
+    # Deduplicate signals on (level, id), keeping the first occurrence
+    unique_by_key = {}
     for signal in all_signals:
-        key = (signal[0], signal[1])
-        if key not in seen:
-            seen.add(key)
-            unique_signals.append(signal)
+        unique_by_key.setdefault((signal.level, signal.id), signal)
+    unique_signals = list(unique_by_key.values())
 
-    # Count by level
-    high_count = sum(1 for s in unique_signals if s[0] == "HIGH")
-    moderate_count = sum(1 for s in unique_signals if s[0] == "MODERATE")
+    # Count by level (each key is unique, so counting keys is enough)
+    level_counts = Counter(level for level, _ in unique_by_key)
+    high_count = level_counts["HIGH"]
+    moderate_count = level_counts["MODERATE"]
 
     # Determine risk level
     if high_count > 0:
@@ -171,10 +259,7 @@ def calculate_risk(files: list[str], explicit_signals: list[str] = None) -> dict
         "file_count": file_analysis["file_count"],
         "high_signals": high_count,
         "moderate_signals": moderate_count,
-        "signals_detected": [
-            {"level": s[0], "id": s[1], "reason": s[2]}
-            for s in unique_signals
-        ],
+        "signals_detected": [s.to_dict() for s in unique_signals],
         "reasoning": reasoning
     }
 
@@ -184,6 +269,8 @@ def main():
     parser.add_argument("--files", type=str, help="Comma-separated list of files")
     parser.add_argument("--signals", type=str, help="Comma-separated list of explicit signals")
     parser.add_argument("--json", action="store_true", help="Read JSON input from stdin")
+    parser.add_argument("--stop-at-high", action="store_true",
+                        help="Stop scanning files at the first HIGH signal (exact level, partial signal list)")
 
     args = parser.parse_args()
 
@@ -205,7 +292,7 @@ def main():
         if args.signals:
             explicit_signals = [s.strip() for s in args.signals.split(",") if s.strip()]
 
-    result = calculate_risk(files, explicit_signals)
+    result = calculate_risk(files, explicit_signals, args.stop_at_high)
     print(json.dumps(result, indent=2))
 
 
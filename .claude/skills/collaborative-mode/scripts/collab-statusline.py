@@ -16,26 +16,69 @@ Usage: Configure in .claude/settings.json:
 
 import json
 import sys
-import subprocess
 from pathlib import Path
 
 
-def get_git_branch() -> str:
-    """Get current git branch name."""
+def find_git_dir(start_dir: str) -> Path | None:
+    """
+    Walk up from start_dir to the repository's git directory.
+
+    Handles worktrees/submodules, where .git is a file pointing elsewhere.
+    """
+    start = Path(start_dir).resolve()
+    for directory in (start, *start.parents):
+        git_path = directory / '.git'
+        if git_path.is_dir():
+            return git_path
+        if git_path.is_file():
+            content = git_path.read_text().strip()
+            if content.startswith('gitdir:'):
+                return directory / content[len('gitdir:'):].strip()
+            return None
+    return None
+
+
+def get_git_branch(current_dir: str) -> str:
+    """Get current git branch name by reading HEAD (no git subprocess)."""
     try:
-        result = subprocess.run(
-            ['git', 'branch', '--show-current'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except Exception:
-        pass
+        git_dir = find_git_dir(current_dir)
+        if git_dir is None:
+            return ""
+        head = (git_dir / 'HEAD').read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+    # Detached HEAD holds a commit hash; like `git branch --show-current`, show nothing
+    if head.startswith('ref: refs/heads/'):
+        return head[len('ref: refs/heads/'):]
     return ""
 
 
+def load_state(state_file: Path) -> dict:
+    """
+    Read the collaborative state file, or {} if it is missing or invalid.
+
+    Reads bytes without a prior exists() check (one fewer stat per render)
+    and parses with orjson when installed.
+    """
+    try:
+        data = state_file.read_bytes()
+    except IOError:
+        return {}
+
+    # Imported here so renders outside collaborative mode skip the import cost
+    try:
+        import orjson
+        loads = orjson.loads
+    except ImportError:
+        loads = json.loads
+
+    try:
+        return loads(data)
+    except json.JSONDecodeError:
+        return {}
+
+
 def main():
     # Read JSON input from Claude Code
     try:
@@ -56,65 +99,58 @@ def main():
     # Look for collaborative state file
     state_file = Path(project_dir) / '.claude' / 'collaborative-state.json'
 
-    if state_file.exists():
-        try:
-            with open(state_file, 'r') as f:
-                state = json.load(f)
-
-            if state.get('active', False):
-                # Extract collaborative session info
-                project = state.get('project', 'unknown')
-                phase = state.get('phase', 'starting')
-                category = state.get('category', '')
-                risk = state.get('risk_level', '—')
-                agents_running = state.get('agents_running', [])
-
-                # Calculate progress
-                progress = state.get('progress', {})
-                done = sum(p.get('completed', 0) for p in progress.values())
-                total = sum(p.get('total', 0) for p in progress.values()) or 32
-
-                # Phase icons (using actual Unicode)
-                phase_icons = {
-                    'understanding': '🎯',
-                    'exploration': '🔍',
-                    'design': '✏️',
-                    'review': '🔄',
-                    'exit': '🚀',
-                    'completed': '✅'
-                }
-                phase_icon = phase_icons.get(phase, '📋')
-
-                # Risk with ANSI colors
-                risk_colors = {
-                    'HIGH': '\033[31m',      # Red
-                    'MODERATE': '\033[33m',  # Yellow
-                    'LOW': '\033[32m'        # Green
-                }
-                reset = '\033[0m'
-                risk_color = risk_colors.get(risk, '')
-                risk_display = f"{risk_color}{risk}{reset}" if risk_color else risk
-
-                # Agent indicator
-                agent_indicator = ""
-                if agents_running:
-                    first_agent = agents_running[0]
-                    agent_indicator = f" ⚡{first_agent}"
-                    if len(agents_running) > 1:
-                        agent_indicator += f"+{len(agents_running) - 1}"
-
-                # Category display
-                category_display = f":{category}" if category else ""
-
-                # Output collaborative status line
-                print(f"[{model}]{style_display} 🤝 {project} {phase_icon} {phase}{category_display} [{done}/{total}] {risk_display}{agent_indicator}")
-                return
-
-        except (json.JSONDecodeError, IOError):
-            pass
+    state = load_state(state_file)
+    if state.get('active', False):
+        # Extract collaborative session info
+        project = state.get('project', 'unknown')
+        phase = state.get('phase', 'starting')
+        category = state.get('category', '')
+        risk = state.get('risk_level', '—')
+        agents_running = state.get('agents_running', [])
+
+        # Calculate progress
+        progress = state.get('progress', {})
+        done = sum(p.get('completed', 0) for p in progress.values())
+        total = sum(p.get('total', 0) for p in progress.values()) or 32
+
+        # Phase icons (using actual Unicode)
+        phase_icons = {
+            'understanding': '🎯',
+            'exploration': '🔍',
+            'design': '✏️',
+            'review': '🔄',
+            'exit': '🚀',
+            'completed': '✅'
+        }
+        phase_icon = phase_icons.get(phase, '📋')
+
+        # Risk with ANSI colors
+        risk_colors = {
+            'HIGH': '\033[31m',      # Red
+            'MODERATE': '\033[33m',  # Yellow
+            'LOW': '\033[32m'        # Green
+        }
+        reset = '\033[0m'
+        risk_color = risk_colors.get(risk, '')
+        risk_display = f"{risk_color}{risk}{reset}" if risk_color else risk
+
+        # Agent indicator
+        agent_indicator = ""
+        if agents_running:
+            first_agent = agents_running[0]
+            agent_indicator = f" ⚡{first_agent}"
+            if len(agents_running) > 1:
+                agent_indicator += f"+{len(agents_running) - 1}"
+
+        # Category display
+        category_display = f":{category}" if category else ""
+
+        # Output collaborative status line
+        print(f"[{model}]{style_display} 🤝 {project} {phase_icon} {phase}{category_display} [{done}/{total}] {risk_display}{agent_indicator}")
+        return
 
     # Default status line (not in collaborative mode)
-    git_branch = get_git_branch()
+    git_branch = get_git_branch(current_dir)
     branch_display = f" | 🌿 {git_branch}" if git_branch else ""
 
     dir_name = Path(current_dir).name or current_dir
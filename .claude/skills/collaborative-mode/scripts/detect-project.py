@@ -18,30 +18,46 @@ Output:
 
 import json
 import os
+import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
-def find_git_root(start_path: str) -> tuple[Path | None, bool]:
+def _is_dir(path: str) -> bool:
+    """Check for a directory with a single stat() call (follows symlinks, like isdir)."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _git_root_cached(path_str: str) -> str | None:
     """
-    Walk up from start_path looking for a .git directory.
-    Returns (project_root, git_found)
+    Return the nearest ancestor of path_str (inclusive) containing a .git directory.
+
+    Memoized per directory, and recursion caches every ancestor on the way up,
+    so lookups from sibling directories in the same repo share the work.
     """
-    current = Path(start_path).resolve()
+    if _is_dir(os.path.join(path_str, ".git")):
+        return path_str
 
-    # Walk up the directory tree
-    while current != current.parent:
-        git_dir = current / ".git"
-        if git_dir.exists() and git_dir.is_dir():
-            return current, True
-        current = current.parent
+    parent = os.path.dirname(path_str)
+    if parent == path_str:
+        return None
+    return _git_root_cached(parent)
 
-    # Check root as well
-    git_dir = current / ".git"
-    if git_dir.exists() and git_dir.is_dir():
-        return current, True
 
-    return None, False
+def find_git_root(start_path: str) -> tuple[Path | None, bool]:
+    """
+    Walk up from start_path looking for a .git directory.
+    Returns (project_root, git_found)
+    """
+    root = _git_root_cached(str(Path(start_path).resolve()))
+    if root is None:
+        return None, False
+    return Path(root), True
 
 
 def detect_project(start_path: str) -> dict:
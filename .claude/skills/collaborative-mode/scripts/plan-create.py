@@ -15,12 +15,18 @@ Output (JSON):
 
 import sys
 import json
+import re
 import argparse
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import uuid
 
 
+# Template placeholders look like {{name}}
+TEMPLATE_VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
 def get_template_path() -> Path:
     """Get path to plan-init.md template."""
     script_dir = Path(__file__).parent
@@ -28,6 +34,15 @@ def get_template_path() -> Path:
     return template_path
 
 
+@lru_cache(maxsize=1)
+def load_template() -> str | None:
+    """Read the plan template once per process (None if it is missing)."""
+    try:
+        return get_template_path().read_text()
+    except FileNotFoundError:
+        return None
+
+
 def create_plan(
     output_dir: Path,
     project: str,
@@ -36,17 +51,15 @@ def create_plan(
     feature_name: str | None = None,
 ) -> dict:
     """Create a new plan file from template."""
-    template_path = get_template_path()
+    # Read template
+    template = load_template()
 
-    if not template_path.exists():
+    if template is None:
         return {
             "success": False,
-            "error": f"Template not found: {template_path}",
+            "error": f"Template not found: {get_template_path()}",
         }
 
-    # Read template
-    template = template_path.read_text()
-
     # Generate metadata
     timestamp = datetime.now().isoformat()
     session_id = str(uuid.uuid4())[:8]
@@ -55,12 +68,18 @@ def create_plan(
     if not feature_name:
         feature_name = slug.replace("-", " ").title()
 
-    # Substitute variables
-    plan_content = template.replace("{{feature_name}}", feature_name)
-    plan_content = plan_content.replace("{{project}}", project)
-    plan_content = plan_content.replace("{{initial_goal}}", goal)
-    plan_content = plan_content.replace("{{timestamp}}", timestamp)
-    plan_content = plan_content.replace("{{session_id}}", session_id)
+    # Substitute variables in one pass (unknown placeholders are left as-is)
+    substitutions = {
+        "feature_name": feature_name,
+        "project": project,
+        "initial_goal": goal,
+        "timestamp": timestamp,
+        "session_id": session_id,
+    }
+    plan_content = TEMPLATE_VAR_RE.sub(
+        lambda m: substitutions.get(m.group(1), m.group(0)),
+        template
+    )
 
     # Create output directory
     output_dir = Path(output_dir)
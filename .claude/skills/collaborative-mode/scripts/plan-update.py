@@ -21,9 +21,10 @@ import sys
 import re
 import argparse
 from pathlib import Path
+from types import MappingProxyType
 
-# Map section paths to markdown headers
-SECTION_MAP = {
+# Map section paths to markdown headers (read-only)
+SECTION_MAP = MappingProxyType({
     # Overview sections
     "overview.scope": "### Scope",
     "overview.users": "### Users",
@@ -67,45 +68,44 @@ SECTION_MAP = {
     "review.risk_summary": "### Risk Summary",
     "review.feasibility": "### Feasibility",
     "review.open_questions": "### Open Questions",
-}
+})
 
+# Sorted once for --list-sections and the unknown-section error
+SORTED_SECTIONS = tuple(sorted(SECTION_MAP))
+
+
+def find_section_bounds(content: str, header: str) -> tuple[int, int]:
+    """
+    Find the start and end character offsets of a section in content.
+
+    The section starts at the header line and ends at the next line starting
+    with "### ", "---" or "## " (or at end of file). A repeated header line
+    restarts the section. Only boundary lines are visited, via one regex.
+    """
+    boundary = re.compile(
+        rf"^(?:[^\S\n]*{re.escape(header)}[^\S\n]*|(?:### |---|## ).*)$",
+        re.MULTILINE
+    )
 
-def find_section_bounds(lines: list[str], header: str) -> tuple[int, int]:
-    """Find the start and end line indices for a section."""
     start_idx = None
-    end_idx = None
-
-    for i, line in enumerate(lines):
-        if line.strip() == header:
-            start_idx = i
-        elif start_idx is not None and line.startswith("### "):
-            # Next section of same level
-            end_idx = i
-            break
-        elif start_idx is not None and line.startswith("---"):
-            # Section divider
-            end_idx = i
-            break
-        elif start_idx is not None and line.startswith("## ") and i > start_idx:
-            # Parent section ended
-            end_idx = i
-            break
+    for match in boundary.finditer(content):
+        if match.group().strip() == header:
+            start_idx = match.start()
+        elif start_idx is not None:
+            return start_idx, match.start()
 
     if start_idx is None:
         return -1, -1
 
     # If no end found, go to end of file
-    if end_idx is None:
-        end_idx = len(lines)
-
-    return start_idx, end_idx
+    return start_idx, len(content)
 
 
 def update_section(plan_path: Path, section: str, content: str) -> bool:
     """Update a section in the plan file."""
     if section not in SECTION_MAP:
         print(f"Error: Unknown section '{section}'", file=sys.stderr)
-        print(f"Valid sections: {', '.join(sorted(SECTION_MAP.keys()))}", file=sys.stderr)
+        print(f"Valid sections: {', '.join(SORTED_SECTIONS)}", file=sys.stderr)
         return False
 
     header = SECTION_MAP[section]
@@ -114,31 +114,25 @@ def update_section(plan_path: Path, section: str, content: str) -> bool:
         print(f"Error: Plan file not found: {plan_path}", file=sys.stderr)
         return False
 
-    lines = plan_path.read_text().splitlines(keepends=True)
-
-    # Normalize line endings
-    lines = [line.rstrip('\r\n') + '\n' for line in lines]
+    # read_text() already normalizes line endings to \n
+    text = plan_path.read_text()
 
-    start_idx, end_idx = find_section_bounds([l.rstrip('\n') for l in lines], header)
+    start_idx, end_idx = find_section_bounds(text, header)
 
     if start_idx == -1:
         print(f"Error: Section '{header}' not found in plan", file=sys.stderr)
         return False
 
-    # Build new section content
-    new_content = [f"{header}\n"]
-
-    # Add the content (ensure proper formatting)
-    content_lines = content.strip().split('\n')
-    for line in content_lines:
-        new_content.append(line + '\n')
-    new_content.append('\n')
+    # Build new section content (header, content, blank line)
+    new_section = header + '\n' + content.strip() + '\n\n'
 
-    # Replace the section
-    new_lines = lines[:start_idx] + new_content + lines[end_idx:]
+    # Splice the section in; the rest of the file is copied, not re-split
+    rest = text[end_idx:]
+    if rest and not rest.endswith('\n'):
+        rest += '\n'
 
     # Write back
-    plan_path.write_text(''.join(new_lines))
+    plan_path.write_text(text[:start_idx] + new_section + rest)
 
     print(f"Updated section: {section}")
     return True
@@ -157,7 +151,7 @@ def main():
 
     if args.list_sections:
         print("Valid sections:")
-        for section in sorted(SECTION_MAP.keys()):
+        for section in SORTED_SECTIONS:
             print(f"  {section}")
         return 0
 
@@ -9,21 +9,32 @@ Features:
 - Detect stale references: paths to files that don't exist
 - Suggest coverage gaps: common patterns not documented
 
-Usage: python audit.py [--path <project-root>]
+Usage: python audit.py [--path <project-root>] [--json]
 
 Output: Markdown report with findings organized by severity
+        (--json: array of finding objects, for tools and CI)
 """
 
 import argparse
-import hashlib
+import json
+import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import NamedTuple
+from typing import Callable
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-class Finding(NamedTuple):
+
+@dataclass(slots=True, frozen=True)
+class Finding:
     severity: str  # "critical" | "high" | "medium" | "low" | "info"
     category: str
     title: str
@@ -35,47 +46,46 @@ class Finding(NamedTuple):
 # Common patterns to check for coverage
 COVERAGE_PATTERNS = {
     "package.json": {
-        "check": lambda p: (p / "package.json").exists(),
+        "check": lambda p, tree: (p / "package.json").exists(),
         "docs_keywords": ["npm", "package.json", "scripts", "dependencies"],
         "suggestion": "Document npm scripts and key dependencies in CLAUDE.md",
     },
     "tsconfig.json": {
-        "check": lambda p: (p / "tsconfig.json").exists(),
+        "check": lambda p, tree: (p / "tsconfig.json").exists(),
         "docs_keywords": ["typescript", "tsconfig", "strict", "paths"],
         "suggestion": "Document TypeScript configuration choices in CLAUDE.md",
     },
     ".env": {
-        "check": lambda p: any(p.glob(".env*")),
+        "check": lambda p, tree: any(name.startswith(".env") for name in tree["root_names"]),
         "docs_keywords": ["environment", ".env", "secrets", "configuration"],
         "suggestion": "Document required environment variables (without values) in CLAUDE.md",
     },
     "docker": {
-        "check": lambda p: (p / "Dockerfile").exists() or (p / "docker-compose.yml").exists(),
+        "check": lambda p, tree: (p / "Dockerfile").exists() or (p / "docker-compose.yml").exists(),
         "docs_keywords": ["docker", "container", "compose"],
         "suggestion": "Document Docker setup and common commands in CLAUDE.md",
     },
     "database": {
-        "check": lambda p: any([
+        "check": lambda p, tree: any([
             (p / "prisma").exists(),
-            any(p.glob("**/migrations/**")),
+            tree["has_migrations"],
             (p / "drizzle.config.ts").exists(),
         ]),
         "docs_keywords": ["database", "migration", "schema", "prisma", "drizzle"],
         "suggestion": "Document database schema and migration workflow in CLAUDE.md",
     },
     "testing": {
-        "check": lambda p: any([
+        "check": lambda p, tree: any([
             (p / "jest.config.js").exists(),
             (p / "jest.config.ts").exists(),
             (p / "vitest.config.ts").exists(),
-            any(p.glob("**/*.test.*")),
-            any(p.glob("**/*.spec.*")),
+            tree["has_test_files"],
         ]),
         "docs_keywords": ["test", "jest", "vitest", "coverage"],
         "suggestion": "Document testing strategy and commands in CLAUDE.md",
     },
     "ci_cd": {
-        "check": lambda p: any([
+        "check": lambda p, tree: any([
             (p / ".github" / "workflows").exists(),
             (p / ".gitlab-ci.yml").exists(),
             (p / "Jenkinsfile").exists(),
@@ -85,6 +95,54 @@ COVERAGE_PATTERNS = {
     },
 }
 
+
+def build_keyword_matcher(patterns: dict[str, dict]) -> Callable[[str], set[str]]:
+    """
+    Build a matcher for the docs_keywords of every coverage pattern.
+
+    Returns a function taking lowercased text and returning the names of the
+    patterns with at least one keyword in it. Uses a single Aho-Corasick pass
+    when pyahocorasick is installed, otherwise one regex search per pattern.
+    """
+    if ahocorasick is not None:
+        keyword_owners: dict[str, set[str]] = defaultdict(set)
+        for name, info in patterns.items():
+            for keyword in info["docs_keywords"]:
+                keyword_owners[keyword].add(name)
+
+        automaton = ahocorasick.Automaton()
+        for keyword, owners in keyword_owners.items():
+            automaton.add_word(keyword, frozenset(owners))
+        automaton.make_automaton()
+
+        def match(text: str) -> set[str]:
+            found: set[str] = set()
+            for _, owners in automaton.iter(text):
+                found |= owners
+            return found
+
+        return match
+
+    regexes = {
+        name: re.compile("|".join(re.escape(keyword) for keyword in info["docs_keywords"]))
+        for name, info in patterns.items()
+    }
+
+    def match(text: str) -> set[str]:
+        return {name for name, regex in regexes.items() if regex.search(text)}
+
+    return match
+
+
+# Built once at import; documentation is scanned once for all keywords
+COVERAGE_KEYWORD_MATCHER = build_keyword_matcher(COVERAGE_PATTERNS)
+
+# Directories never searched for rules files (VCS metadata, vendored trees)
+RULES_SKIP_DIRS = frozenset({".git", "node_modules", ".venv", "__pycache__"})
+
+# Directories never searched when indexing the project tree
+SKIP_DIRS = RULES_SKIP_DIRS | {"dist", "build"}
+
 # Keywords that might indicate contradictory rules
 CONTRADICTION_KEYWORDS = {
     "use": "avoid",
@@ -94,6 +152,29 @@ CONTRADICTION_KEYWORDS = {
     "required": "optional",
     "enable": "disable",
 }
+CONTRADICTION_WORDS = frozenset(CONTRADICTION_KEYWORDS) | frozenset(CONTRADICTION_KEYWORDS.values())
+
+# Rule and reference patterns, compiled once at import
+FRONTMATTER_RE = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
+FRONTMATTER_CLOSE_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+BULLET_RE = re.compile(r"^\s*[-*]\s+(.+)$", re.MULTILINE)
+NUMBERED_RE = re.compile(r"^\s*\d+\.\s+(.+)$", re.MULTILINE)
+PATH_REF_RE = re.compile(r'`([a-zA-Z0-9_\-./]+\.[a-zA-Z0-9]{2,})`')
+DIR_REF_RE = re.compile(r'`(\./[a-zA-Z0-9_\-./]+)`')
+VERSION_RE = re.compile(r'^\d+\.\d+(\.\d+)?$')
+
+# Common false positive patterns to skip
+REFERENCE_SKIP_PATTERNS = frozenset({
+    "e.g", "i.e", "etc.", "vs.", "a.k.a",  # Abbreviations
+    "1.0", "2.0", "3.0", "0.1", "0.0",  # Version numbers
+})
+
+# Common documentation-only files that might not exist yet
+DOC_ONLY_FILES = frozenset({
+    "CLAUDE.local.md",  # May be gitignored/not created
+    "example.ts", "example.js", "example.py",  # Example references
+    "my-file.ts", "your-file.js",  # Placeholder names
+})
 
 
 def parse_frontmatter(content: str) -> dict[str, str | list[str]]:
@@ -101,18 +182,16 @@ def parse_frontmatter(content: str) -> dict[str, str | list[str]]:
     if not content.startswith("---"):
         return {}
 
-    lines = content.split("\n")
-    end_index = -1
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_index = i
-            break
-
-    if end_index == -1:
+    # Locate the closing --- line without splitting the rest of the file
+    header_start = content.find("\n") + 1
+    if not header_start:
+        return {}
+    closing = FRONTMATTER_CLOSE_RE.search(content, header_start)
+    if not closing:
         return {}
 
     frontmatter: dict[str, str | list[str]] = {}
-    yaml_lines = lines[1:end_index]
+    yaml_lines = content[header_start:closing.start()].split("\n")
 
     for line in yaml_lines:
         line = line.strip()
@@ -142,18 +221,16 @@ def extract_rules(content: str) -> list[str]:
 
     # Skip frontmatter
     if content.startswith("---"):
-        match = re.search(r"^---\s*\n.*?\n---\s*\n", content, re.DOTALL)
+        match = FRONTMATTER_RE.search(content)
         if match:
             content = content[match.end():]
 
     # Extract bullet points
-    bullet_pattern = re.compile(r"^\s*[-*]\s+(.+)$", re.MULTILINE)
-    for match in bullet_pattern.finditer(content):
+    for match in BULLET_RE.finditer(content):
         rules.append(match.group(1).strip())
 
     # Extract numbered items
-    numbered_pattern = re.compile(r"^\s*\d+\.\s+(.+)$", re.MULTILINE)
-    for match in numbered_pattern.finditer(content):
+    for match in NUMBERED_RE.finditer(content):
         rules.append(match.group(1).strip())
 
     return rules
@@ -163,48 +240,76 @@ def extract_file_references(content: str) -> list[str]:
     """Extract file/path references from content."""
     references: list[str] = []
 
-    # Common false positive patterns to skip
-    skip_patterns = {
-        "e.g", "i.e", "etc.", "vs.", "a.k.a",  # Abbreviations
-        "1.0", "2.0", "3.0", "0.1", "0.0",  # Version numbers
-    }
-
-    # Common documentation-only files that might not exist yet
-    doc_only_files = {
-        "CLAUDE.local.md",  # May be gitignored/not created
-        "example.ts", "example.js", "example.py",  # Example references
-        "my-file.ts", "your-file.js",  # Placeholder names
-    }
-
     # Match file paths with extensions (require at least 2 char extension)
-    path_pattern = re.compile(r'`([a-zA-Z0-9_\-./]+\.[a-zA-Z0-9]{2,})`')
-    for match in path_pattern.finditer(content):
+    for match in PATH_REF_RE.finditer(content):
         path = match.group(1)
         # Filter out URLs and common non-file patterns
         if path.startswith("http") or path.startswith("www"):
             continue
-        if path in skip_patterns:
+        if path in REFERENCE_SKIP_PATTERNS:
             continue
-        if Path(path).name in doc_only_files:
+        if Path(path).name in DOC_ONLY_FILES:
             continue
         # Skip if looks like a version (x.y.z pattern)
-        if re.match(r'^\d+\.\d+(\.\d+)?$', path):
+        if VERSION_RE.match(path):
             continue
         references.append(path)
 
     # Match directory references (explicit ./ prefix)
-    dir_pattern = re.compile(r'`(\./[a-zA-Z0-9_\-./]+)`')
-    for match in dir_pattern.finditer(content):
+    for match in DIR_REF_RE.finditer(content):
         references.append(match.group(1))
 
     return list(set(references))
 
 
-def content_hash(text: str) -> str:
-    """Generate a hash for content comparison."""
-    # Normalize whitespace for comparison
-    normalized = " ".join(text.split())
-    return hashlib.md5(normalized.encode()).hexdigest()[:8]
+def read_memory_file(file_path: Path) -> tuple[str | None, Exception | None]:
+    """Read a memory file, returning (content, None) or (None, error)."""
+    try:
+        return file_path.read_text(encoding="utf-8"), None
+    except Exception as e:
+        return None, e
+
+
+def index_project_names(project_root: Path) -> set[str]:
+    """Collect every file and directory name under project_root in one walk."""
+    names: set[str] = set()
+    for _, dirs, filenames in os.walk(project_root):
+        names.update(dirs)
+        names.update(filenames)
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    return names
+
+
+def scan_project(project_root: Path) -> dict[str, bool | set[str]]:
+    """
+    Walk the project tree once, collecting what the coverage checks need.
+
+    Returns top-level entry names plus flags for a migrations directory and
+    *.test.* / *.spec.* files anywhere; the walk stops once both flags are set.
+    """
+    tree: dict[str, bool | set[str]] = {
+        "root_names": set(),
+        "has_migrations": False,
+        "has_test_files": False,
+    }
+
+    for current, dirs, filenames in os.walk(project_root):
+        if current == str(project_root):
+            tree["root_names"] = set(dirs) | set(filenames)
+
+        if not tree["has_migrations"] and "migrations" in dirs:
+            tree["has_migrations"] = True
+        if not tree["has_test_files"]:
+            tree["has_test_files"] = any(
+                fnmatchcase(name, "*.test.*") or fnmatchcase(name, "*.spec.*")
+                for name in (*dirs, *filenames)
+            )
+        if tree["has_migrations"] and tree["has_test_files"]:
+            break
+
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+    return tree
 
 
 def find_memory_files(project_root: Path) -> list[Path]:
@@ -231,53 +336,59 @@ def find_memory_files(project_root: Path) -> list[Path]:
         # Rules directory
         rules_dir = claude_dir / "rules"
         if rules_dir.exists():
-            files.extend(rules_dir.rglob("*.md"))
+            # Same walk as rglob (symlinked dirs not followed), minus vendored/VCS trees
+            for current, dirs, filenames in os.walk(rules_dir):
+                dirs[:] = [d for d in dirs if d not in RULES_SKIP_DIRS]
+                files.extend(Path(current, name) for name in filenames if name.endswith(".md"))
 
     return files
 
 
-def detect_conflicts(files_content: dict[Path, str]) -> list[Finding]:
-    """Detect contradictory rules across files."""
+def detect_conflicts(file_rules: dict[Path, list[str]]) -> list[Finding]:
+    """Detect contradictory rules across files (takes rules from extract_rules per file)."""
     findings: list[Finding] = []
 
     # Skip conflict detection if only one file (can't have conflicts)
-    if len(files_content) < 2:
+    if len(file_rules) < 2:
         return findings
 
-    # Extract rules from each file
-    file_rules: dict[Path, list[str]] = {}
-    for file_path, content in files_content.items():
-        file_rules[file_path] = extract_rules(content)
-
-    # Check for contradictions across different files only
-    for positive, negative in CONTRADICTION_KEYWORDS.items():
-        positive_files: dict[str, list[tuple[Path, str]]] = defaultdict(list)
-        negative_files: dict[str, list[tuple[Path, str]]] = defaultdict(list)
-
-        for file_path, rules in file_rules.items():
-            for rule in rules:
-                rule_lower = rule.lower()
-                # Extract the subject being discussed
-                words = rule_lower.split()
-
-                if positive in words:
-                    # Find the subject (word after the keyword)
-                    idx = words.index(positive)
-                    if idx + 1 < len(words):
-                        subject = words[idx + 1]
-                        # Skip common false positives (short words, punctuation)
-                        if len(subject) < 3 or not subject.isalnum():
-                            continue
-                        positive_files[subject].append((file_path, rule))
-
-                if negative in words:
-                    idx = words.index(negative)
-                    if idx + 1 < len(words):
-                        subject = words[idx + 1]
-                        if len(subject) < 3 or not subject.isalnum():
-                            continue
-                        negative_files[subject].append((file_path, rule))
+    # Subject occurrences per keyword pair: (positive_files, negative_files)
+    pair_subjects: dict[tuple[str, str], tuple[dict, dict]] = {
+        pair: (defaultdict(list), defaultdict(list))
+        for pair in CONTRADICTION_KEYWORDS.items()
+    }
 
+    # One split per rule; keyword positions come from a dict, not words.index
+    for file_path, rules in file_rules.items():
+        for rule in rules:
+            # Extract the subject being discussed
+            words = rule.lower().split()
+
+            first_index: dict[str, int] = {}
+            for i, word in enumerate(words):
+                if word in CONTRADICTION_WORDS and word not in first_index:
+                    first_index[word] = i
+            if not first_index:
+                continue
+
+            for (positive, negative), (positive_files, negative_files) in pair_subjects.items():
+                idx = first_index.get(positive)
+                # Find the subject (word after the keyword)
+                if idx is not None and idx + 1 < len(words):
+                    subject = words[idx + 1]
+                    # Skip common false positives (short words, punctuation)
+                    if len(subject) < 3 or not subject.isalnum():
+                        continue
+                    positive_files[subject].append((file_path, rule))
+
+                idx = first_index.get(negative)
+                if idx is not None and idx + 1 < len(words):
+                    subject = words[idx + 1]
+                    if len(subject) < 3 or not subject.isalnum():
+                        continue
+                    negative_files[subject].append((file_path, rule))
+
+    for (positive, negative), (positive_files, negative_files) in pair_subjects.items():
         # Find conflicts - only flag if rules are in DIFFERENT files
         for subject in set(positive_files.keys()) & set(negative_files.keys()):
             pos_entries = positive_files[subject]
@@ -301,22 +412,21 @@ def detect_conflicts(files_content: dict[Path, str]) -> list[Finding]:
     return findings
 
 
-def detect_duplication(files_content: dict[Path, str]) -> list[Finding]:
-    """Detect duplicate content across files."""
+def detect_duplication(file_rules: dict[Path, list[str]]) -> list[Finding]:
+    """Detect duplicate content across files (takes rules from extract_rules per file)."""
     findings: list[Finding] = []
 
-    # Extract content blocks and their hashes
+    # Group rules by whitespace-normalized text; the dict's own string
+    # hashing does the comparison, so no separate digest is needed
     block_locations: dict[str, list[tuple[Path, str]]] = defaultdict(list)
 
-    for file_path, content in files_content.items():
-        rules = extract_rules(content)
+    for file_path, rules in file_rules.items():
         for rule in rules:
             if len(rule) > 20:  # Only check substantial rules
-                h = content_hash(rule)
-                block_locations[h].append((file_path, rule))
+                block_locations[" ".join(rule.split())].append((file_path, rule))
 
     # Find duplicates
-    for hash_val, locations in block_locations.items():
+    for locations in block_locations.values():
         if len(locations) > 1:
             files = list(set(str(loc[0]) for loc in locations))
             sample_content = locations[0][1][:100]
@@ -337,26 +447,31 @@ def detect_stale_references(files_content: dict[Path, str], project_root: Path)
     """Detect references to files that don't exist."""
     findings: list[Finding] = []
 
+    # Names anywhere in the tree, built on first need (one walk, not one per reference)
+    project_names: set[str] | None = None
+
+    # stat() results by path; the same reference often appears in several files
+    known_paths: dict[Path, bool] = {}
+
+    def path_exists(path: Path) -> bool:
+        if path not in known_paths:
+            known_paths[path] = path.exists()
+        return known_paths[path]
+
     for file_path, content in files_content.items():
         references = extract_file_references(content)
 
         for ref in references:
-            # Skip common false positives
-            if ref.startswith("http") or "@" in ref:
+            # Skip common false positives, and glob patterns (nothing to stat)
+            if ref.startswith("http") or "@" in ref or "*" in ref:
                 continue
 
-            # Try to resolve the reference
-            ref_path = project_root / ref
-            relative_ref = file_path.parent / ref
-
-            if not ref_path.exists() and not relative_ref.exists():
-                # Check if it's a glob pattern
-                if "*" in ref:
-                    continue
-
-                # Check if any file matches partially
-                ref_name = Path(ref).name
-                if not list(project_root.rglob(ref_name)):
+            # Try to resolve the reference, from the root and from the file's directory
+            if not path_exists(project_root / ref) and not path_exists(file_path.parent / ref):
+                # Check if a file with the same name exists anywhere
+                if project_names is None:
+                    project_names = index_project_names(project_root)
+                if Path(ref).name not in project_names:
                     findings.append(Finding(
                         severity="low",
                         category="stale_reference",
@@ -373,17 +488,19 @@ def detect_coverage_gaps(files_content: dict[Path, str], project_root: Path) ->
     """Detect common patterns not documented."""
     findings: list[Finding] = []
 
-    # Combine all content for keyword search
-    all_content = " ".join(files_content.values()).lower()
+    # Keyword search file by file, so no joined copy of all content is built
+    documented: set[str] = set()
+    for content in files_content.values():
+        documented |= COVERAGE_KEYWORD_MATCHER(content.lower())
+
+    # One tree walk shared by every check
+    tree = scan_project(project_root)
 
     for pattern_name, pattern_info in COVERAGE_PATTERNS.items():
         # Check if pattern exists in project
-        if pattern_info["check"](project_root):
+        if pattern_info["check"](project_root, tree):
             # Check if documented
-            keywords = pattern_info["docs_keywords"]
-            documented = any(kw in all_content for kw in keywords)
-
-            if not documented:
+            if pattern_name not in documented:
                 findings.append(Finding(
                     severity="info",
                     category="coverage_gap",
@@ -406,19 +523,20 @@ def generate_report(findings: list[Finding], project_root: Path) -> str:
         "",
     ]
 
-    # Summary
-    severity_counts = defaultdict(int)
+    # Group by severity in one pass; counts come from the groups
+    by_severity: dict[str, list[Finding]] = defaultdict(list)
     for finding in findings:
-        severity_counts[finding.severity] += 1
+        by_severity[finding.severity].append(finding)
 
+    # Summary
     lines.extend([
         "## Summary",
         "",
-        f"- Critical: {severity_counts.get('critical', 0)}",
-        f"- High: {severity_counts.get('high', 0)}",
-        f"- Medium: {severity_counts.get('medium', 0)}",
-        f"- Low: {severity_counts.get('low', 0)}",
-        f"- Info: {severity_counts.get('info', 0)}",
+        f"- Critical: {len(by_severity['critical'])}",
+        f"- High: {len(by_severity['high'])}",
+        f"- Medium: {len(by_severity['medium'])}",
+        f"- Low: {len(by_severity['low'])}",
+        f"- Info: {len(by_severity['info'])}",
         "",
     ])
 
@@ -426,11 +544,10 @@ def generate_report(findings: list[Finding], project_root: Path) -> str:
         lines.append("No issues found. Your memory configuration looks good!")
         return "\n".join(lines)
 
-    # Group by severity
     severity_order = ["critical", "high", "medium", "low", "info"]
 
     for severity in severity_order:
-        severity_findings = [f for f in findings if f.severity == severity]
+        severity_findings = by_severity[severity]
         if not severity_findings:
             continue
 
@@ -451,8 +568,7 @@ def generate_report(findings: list[Finding], project_root: Path) -> str:
 
             if finding.files:
                 lines.append("**Files:**")
-                for f in finding.files:
-                    lines.append(f"- `{f}`")
+                lines.extend(f"- `{f}`" for f in finding.files)
                 lines.append("")
 
             if finding.suggestion:
@@ -473,6 +589,11 @@ def main() -> int:
         default=".",
         help="Project root path (default: current directory)",
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print findings as a JSON array instead of the markdown report",
+    )
     args = parser.parse_args()
 
     project_root = Path(args.path).resolve()
@@ -486,6 +607,9 @@ def main() -> int:
 
     if not memory_files:
         print(f"No memory files found in {project_root}", file=sys.stderr)
+        if args.json:
+            print("[]")
+            return 0
         print("\nExpected files:")
         print("  - CLAUDE.md")
         print("  - CLAUDE.local.md")
@@ -493,18 +617,23 @@ def main() -> int:
         print("  - .claude/rules/*.md")
         return 0
 
-    # Read all files
+    # Read all files, overlapping the I/O across a small thread pool
     files_content: dict[Path, str] = {}
-    for file_path in memory_files:
-        try:
-            files_content[file_path] = file_path.read_text(encoding="utf-8")
-        except Exception as e:
-            print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=min(8, len(memory_files))) as executor:
+        results = executor.map(read_memory_file, memory_files)
+        for file_path, (content, error) in zip(memory_files, results):
+            if error is not None:
+                print(f"Warning: Could not read {file_path}: {error}", file=sys.stderr)
+            else:
+                files_content[file_path] = content
+
+    # Extract rules once; both rule-based audits share them
+    file_rules = {path: extract_rules(content) for path, content in files_content.items()}
 
     # Run all audits
     findings: list[Finding] = []
-    findings.extend(detect_conflicts(files_content))
-    findings.extend(detect_duplication(files_content))
+    findings.extend(detect_conflicts(file_rules))
+    findings.extend(detect_duplication(file_rules))
     findings.extend(detect_stale_references(files_content, project_root))
     findings.extend(detect_coverage_gaps(files_content, project_root))
 
@@ -512,9 +641,12 @@ def main() -> int:
     severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
     findings.sort(key=lambda f: severity_order.get(f.severity, 5))
 
-    # Generate and print report
-    report = generate_report(findings, project_root)
-    print(report)
+    # Generate and print report (JSON consumers skip the markdown rendering)
+    if args.json:
+        json.dump([asdict(f) for f in findings], sys.stdout)
+        print()
+    else:
+        print(generate_report(findings, project_root))
 
     # Return non-zero if critical or high issues found
     has_serious = any(f.severity in ("critical", "high") for f in findings)
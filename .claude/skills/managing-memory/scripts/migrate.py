@@ -19,11 +19,12 @@ Output: Migration plan in markdown format
 import argparse
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Represents a section of the CLAUDE.md file."""
     title: str
@@ -31,7 +32,7 @@ class Section:
     content: str
     line_start: int
     line_end: int
-    subsections: list["Section"] = field(default_factory=list)
+    subsections: list["Section"] | None = None  # created on first use
 
 
 @dataclass
@@ -44,6 +45,7 @@ class MigrationTarget:
     frontmatter: dict[str, str | list[str]]
     source_sections: list[str]
     reason: str
+    rendered_frontmatter: str = ""  # YAML block shared by plan and execution
 
 
 # Keywords that suggest which paths a rule file should apply to
@@ -78,82 +80,142 @@ SECTION_CATEGORIES = {
     "frontend": ["component", "react", "ui", "style", "css"],
 }
 
+# Precompiled patterns. The header and delimiter patterns scan the whole
+# document in multiline mode, so their whitespace classes exclude "\n".
+# NEWLINE_HEADER_RE leads with a literal "\n", which lets the regex engine
+# skip ahead between line starts instead of trying "^" at every character.
+HEADER_RE = re.compile(r"(#{1,6})[^\S\n]+(.+)$", re.MULTILINE)
+NEWLINE_HEADER_RE = re.compile(r"\n(#{1,6})[^\S\n]+(.+)$", re.MULTILINE)
+FRONTMATTER_DELIMITER_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+FRONTMATTER_BLOCK_RE = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
+DASHES_RE = re.compile(r"-+")
+
+
+class FilenameCharTable(dict):
+    """
+    str.translate table deleting every character outside [\\w\\s-], the
+    characters a rule filename may keep. Entries are computed on first
+    lookup and cached, so repeat lookups stay in C.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        keep = char.isalnum() or char == "_" or char.isspace() or char == "-"
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+
+FILENAME_CHAR_TABLE = FilenameCharTable()
+
+
+def iter_headers(content: str, start: int) -> Iterator[re.Match[str]]:
+    """Yield header matches for lines at or after offset start (a line start)."""
+    first = HEADER_RE.match(content, start)
+    if first:
+        yield first
+    yield from NEWLINE_HEADER_RE.finditer(content, start)
+
 
 def parse_sections(content: str) -> list[Section]:
-    """Parse markdown content into sections based on headers."""
-    lines = content.split("\n")
+    """
+    Parse markdown content into sections based on headers.
+
+    Headers are found with one regex scan over the whole document rather
+    than a match per line; line numbers come from counting newlines
+    between consecutive headers.
+    """
     sections: list[Section] = []
     current_section: Section | None = None
-    content_buffer: list[str] = []
-    content_start = 0
 
     # Skip frontmatter if present
-    start_line = 0
-    if lines and lines[0].strip() == "---":
-        for i in range(1, len(lines)):
-            if lines[i].strip() == "---":
-                start_line = i + 1
-                break
-
-    for i, line in enumerate(lines[start_line:], start=start_line):
-        header_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-
-        if header_match:
-            # Save previous section
-            if current_section:
-                current_section.content = "\n".join(content_buffer).strip()
-                current_section.line_end = i - 1
-                sections.append(current_section)
-
-            # Start new section
-            level = len(header_match.group(1))
-            title = header_match.group(2).strip()
-            current_section = Section(
-                title=title,
-                level=level,
-                content="",
-                line_start=i + 1,
-                line_end=i + 1,
-            )
-            content_buffer = []
-            content_start = i + 1
-        else:
-            content_buffer.append(line)
+    start = 0
+    first_end = content.find("\n")
+    if first_end != -1 and content[:first_end].strip() == "---":
+        close = FRONTMATTER_DELIMITER_RE.search(content, first_end + 1)
+        if close:
+            start = close.end() + 1
+
+    # A section's body runs from the line after its header to the newline
+    # before the next header
+    line_index = content.count("\n", 0, start)
+    pos = start
+    body_start = 0
+
+    for header_match in iter_headers(content, start):
+        line_index += content.count("\n", pos, header_match.start(1))
+        pos = header_match.start(1)
+
+        # Save previous section
+        if current_section:
+            current_section.content = content[body_start:pos - 1].strip()
+            current_section.line_end = line_index - 1
+            sections.append(current_section)
+
+        # Start new section
+        level = len(header_match.group(1))
+        title = header_match.group(2).strip()
+        current_section = Section(
+            title=title,
+            level=level,
+            content="",
+            line_start=line_index + 1,
+            line_end=line_index + 1,
+        )
+        body_start = header_match.end() + 1
 
     # Don't forget the last section
     if current_section:
-        current_section.content = "\n".join(content_buffer).strip()
-        current_section.line_end = len(lines)
+        current_section.content = content[body_start:].strip()
+        current_section.line_end = content.count("\n") + 1
         sections.append(current_section)
 
     return sections
 
 
-def categorize_section(section: Section) -> str | None:
-    """Determine the category of a section based on its content."""
-    text = f"{section.title} {section.content}".lower()
+def section_text(section: Section) -> str:
+    """Lowercased title and content, the text keyword checks search."""
+    return f"{section.title} {section.content}".lower()
+
 
+def categorize_section(section: Section, text: str | None = None) -> str | None:
+    """
+    Determine the category of a section based on its content.
+    Pass text (from section_text) to reuse one lowercased copy across checks.
+    """
+    if text is None:
+        text = section_text(section)
+
+    # Substring `in` is a fast C search; stop at the second hit per category
     for category, keywords in SECTION_CATEGORIES.items():
-        matches = sum(1 for kw in keywords if kw in text)
-        if matches >= 2:
-            return category
+        matches = 0
+        for kw in keywords:
+            if kw in text:
+                matches += 1
+                if matches == 2:
+                    return category
 
     return None
 
 
-def suggest_paths(section: Section) -> list[str]:
+def suggest_paths(section: Section, text: str | None = None) -> list[str]:
     """Suggest glob patterns for paths frontmatter based on section content."""
-    text = f"{section.title} {section.content}".lower()
-    paths: list[str] = []
+    if text is None:
+        text = section_text(section)
+    # dict keys dedupe while keeping first-seen order, so plans are stable run to run
+    paths: dict[str, None] = {}
 
     for keyword, patterns in PATH_KEYWORDS.items():
         if keyword in text:
-            paths.extend(patterns)
+            paths.update(dict.fromkeys(patterns))
 
-    return list(set(paths))
+    return list(paths)
 
 
-def should_extract(section: Section, all_sections: list[Section]) -> bool:
+def should_extract(
+    section: Section,
+    all_sections: list[Section],
+    text: str | None = None,
+) -> bool:
     """Determine if a section should be extracted to a separate file."""
     # Extract if:
     # 1. It's a top-level section (level 1 or 2)
@@ -166,7 +228,7 @@ def should_extract(section: Section, all_sections: list[Section]) -> bool:
     if len(section.content) < 100:
         return False
 
-    category = categorize_section(section)
+    category = categorize_section(section, text)
     if category:
         return True
 
@@ -181,9 +243,11 @@ def should_extract(section: Section, all_sections: list[Section]) -> bool:
 def generate_filename(title: str, category: str | None) -> str:
     """Generate a suitable filename for a rule file."""
     # Clean the title
-    clean = re.sub(r"[^\w\s-]", "", title.lower())
-    clean = re.sub(r"\s+", "-", clean.strip())
-    clean = re.sub(r"-+", "-", clean)
+    # Drop disallowed characters, dash-join the whitespace-separated words,
+    # then collapse dash runs (only present if the title had them)
+    clean = "-".join(title.lower().translate(FILENAME_CHAR_TABLE).split())
+    if "--" in clean:
+        clean = DASHES_RE.sub("-", clean)
 
     # Truncate if too long
     if len(clean) > 30:
@@ -214,8 +278,11 @@ def generate_frontmatter(
     return "\n".join(lines)
 
 
-def analyze_claude_md(file_path: Path) -> list[MigrationTarget]:
-    """Analyze CLAUDE.md and generate migration targets."""
+def analyze_claude_md(file_path: Path) -> tuple[list[MigrationTarget], str]:
+    """
+    Analyze CLAUDE.md and generate migration targets.
+    Returns (targets, content) so the caller can reuse the file content.
+    """
     content = file_path.read_text(encoding="utf-8")
     sections = parse_sections(content)
 
@@ -223,9 +290,11 @@ def analyze_claude_md(file_path: Path) -> list[MigrationTarget]:
     remaining_content: list[str] = []
 
     for section in sections:
-        if should_extract(section, sections):
-            category = categorize_section(section)
-            paths = suggest_paths(section)
+        # Lowercase each section once for all of its keyword checks
+        text = section_text(section)
+        if should_extract(section, sections, text):
+            category = categorize_section(section, text)
+            paths = suggest_paths(section, text)
 
             filename = generate_filename(section.title, category)
 
@@ -248,6 +317,7 @@ def analyze_claude_md(file_path: Path) -> list[MigrationTarget]:
                 frontmatter=frontmatter,
                 source_sections=[section.title],
                 reason=f"Category: {category}" if category else "Substantial standalone section",
+                rendered_frontmatter=generate_frontmatter(section.title, description, paths),
             )
             targets.append(target)
         else:
@@ -258,7 +328,58 @@ def analyze_claude_md(file_path: Path) -> list[MigrationTarget]:
                 remaining_content.append(section.content)
                 remaining_content.append("")
 
-    return targets
+    return targets, content
+
+
+# Migration plan templates; each renders one chunk of the joined plan
+PLAN_HEADER_TEMPLATE = """# Migration Plan
+
+**Source:** `{source_file}`
+**Target Directory:** `.claude/rules/`
+
+## Summary
+
+- **Sections to extract:** {count}
+- **New rule files to create:** {count}
+
+## Files to Create
+"""
+
+PLAN_TARGET_TEMPLATE = """### {index}. `{filename}`
+
+**Source Section:** {title}
+**Reason:** {reason}
+
+{suggested_paths}**Frontmatter:**
+```yaml
+{frontmatter}
+```
+
+**Content Preview:**
+```markdown
+{preview}
+```
+"""
+
+PLAN_FOOTER_TEMPLATE = """## Remaining in CLAUDE.md
+
+After migration, the main CLAUDE.md should contain:
+- Project overview and quick reference
+- Links/imports to rule files
+- Configuration that doesn't fit a specific category
+
+## Execution
+
+To apply this migration, run:
+```bash
+python migrate.py {source_file} --execute
+```
+
+This will:
+1. Create `.claude/rules/` directory if needed
+2. Create all rule files with frontmatter
+3. Update the original CLAUDE.md with @import references
+"""
 
 
 def generate_migration_plan(
@@ -266,90 +387,42 @@ def generate_migration_plan(
     targets: list[MigrationTarget],
 ) -> str:
     """Generate a markdown migration plan."""
-    lines = [
-        "# Migration Plan",
-        "",
-        f"**Source:** `{source_file}`",
-        f"**Target Directory:** `.claude/rules/`",
-        "",
-        "## Summary",
-        "",
-        f"- **Sections to extract:** {len(targets)}",
-        f"- **New rule files to create:** {len(targets)}",
-        "",
-        "## Files to Create",
-        "",
-    ]
+    chunks = [PLAN_HEADER_TEMPLATE.format(source_file=source_file, count=len(targets))]
 
     for i, target in enumerate(targets, 1):
-        lines.extend([
-            f"### {i}. `{target.filename}`",
-            "",
-            f"**Source Section:** {target.title}",
-            f"**Reason:** {target.reason}",
-            "",
-        ])
-
+        suggested_paths = ""
         if target.frontmatter.get("paths"):
             paths = target.frontmatter["paths"]
             if isinstance(paths, list):
                 paths_str = ", ".join(f"`{p}`" for p in paths)
             else:
                 paths_str = f"`{paths}`"
-            lines.append(f"**Suggested Paths:** {paths_str}")
-            lines.append("")
-
-        lines.extend([
-            "**Frontmatter:**",
-            "```yaml",
-        ])
-
-        fm = generate_frontmatter(
-            target.title,
-            target.frontmatter.get("description", ""),  # type: ignore
-            target.frontmatter.get("paths"),  # type: ignore
-        )
-        lines.append(fm)
-        lines.extend([
-            "```",
-            "",
-            "**Content Preview:**",
-            "```markdown",
-            target.content[:500] + ("..." if len(target.content) > 500 else ""),
-            "```",
-            "",
-        ])
-
-    lines.extend([
-        "## Remaining in CLAUDE.md",
-        "",
-        "After migration, the main CLAUDE.md should contain:",
-        "- Project overview and quick reference",
-        "- Links/imports to rule files",
-        "- Configuration that doesn't fit a specific category",
-        "",
-        "## Execution",
-        "",
-        "To apply this migration, run:",
-        "```bash",
-        f"python migrate.py {source_file} --execute",
-        "```",
-        "",
-        "This will:",
-        "1. Create `.claude/rules/` directory if needed",
-        "2. Create all rule files with frontmatter",
-        "3. Update the original CLAUDE.md with @import references",
-        "",
-    ])
+            suggested_paths = f"**Suggested Paths:** {paths_str}\n\n"
 
-    return "\n".join(lines)
+        chunks.append(PLAN_TARGET_TEMPLATE.format(
+            index=i,
+            filename=target.filename,
+            title=target.title,
+            reason=target.reason,
+            suggested_paths=suggested_paths,
+            frontmatter=target.rendered_frontmatter,
+            preview=target.content[:500] + ("..." if len(target.content) > 500 else ""),
+        ))
+
+    chunks.append(PLAN_FOOTER_TEMPLATE.format(source_file=source_file))
+
+    return "\n".join(chunks)
 
 
 def execute_migration(
     source_file: Path,
     targets: list[MigrationTarget],
+    original_content: str | None = None,
 ) -> None:
-    """Execute the migration plan."""
+    """
+    Execute the migration plan.
+    original_content is the source as analyzed; it is read again if omitted.
+    """
     project_root = source_file.parent
     if source_file.name == "CLAUDE.md" and (project_root / ".claude").exists():
         rules_dir = project_root / ".claude" / "rules"
@@ -366,24 +439,22 @@ def execute_migration(
         file_path = rules_dir / target.filename
 
         # Generate full content
-        frontmatter = generate_frontmatter(
-            target.title,
-            target.frontmatter.get("description", ""),  # type: ignore
-            target.frontmatter.get("paths"),  # type: ignore
-        )
-
-        full_content = f"{frontmatter}\n\n# {target.title}\n\n{target.content}\n"
+        full_content = f"{target.rendered_frontmatter}\n\n# {target.title}\n\n{target.content}\n"
 
         file_path.write_text(full_content, encoding="utf-8")
         created_files.append(str(file_path))
-        print(f"Created: {file_path}")
+
+    # Report all created files with one write to stdout
+    if created_files:
+        print("\n".join(f"Created: {path}" for path in created_files))
 
     # Update source CLAUDE.md with imports
-    original_content = source_file.read_text(encoding="utf-8")
+    if original_content is None:
+        original_content = source_file.read_text(encoding="utf-8")
 
     # Find where to add imports (after frontmatter if present)
     if original_content.startswith("---"):
-        match = re.search(r"^---\s*\n.*?\n---\s*\n", original_content, re.DOTALL)
+        match = FRONTMATTER_BLOCK_RE.search(original_content)
         if match:
             insert_pos = match.end()
         else:
@@ -392,24 +463,16 @@ def execute_migration(
         insert_pos = 0
 
     # Build import section
-    import_lines = [
-        "",
-        "<!-- Modular rules - auto-generated by migrate.py -->",
-    ]
-    for target in targets:
-        import_lines.append(f"@import('.claude/rules/{target.filename}')")
-    import_lines.extend([
-        "<!-- End modular rules -->",
-        "",
-    ])
+    imports = "".join(f"@import('.claude/rules/{target.filename}')\n" for target in targets)
+    import_section = (
+        "\n<!-- Modular rules - auto-generated by migrate.py -->\n"
+        f"{imports}"
+        "<!-- End modular rules -->\n"
+    )
 
     # Note: In a production version, we would also remove the migrated sections
     # For safety, we just add imports and let the user clean up manually
-    new_content = (
-        original_content[:insert_pos] +
-        "\n".join(import_lines) +
-        original_content[insert_pos:]
-    )
+    new_content = original_content[:insert_pos] + import_section + original_content[insert_pos:]
 
     source_file.write_text(new_content, encoding="utf-8")
     print(f"Updated: {source_file}")
@@ -452,7 +515,7 @@ def main() -> int:
         return 1
 
     # Analyze the file
-    targets = analyze_claude_md(source_file)
+    targets, content = analyze_claude_md(source_file)
 
     if not targets:
         print("No sections identified for extraction.")
@@ -462,7 +525,7 @@ def main() -> int:
     if args.execute:
         print("Executing migration...")
         print()
-        execute_migration(source_file, targets)
+        execute_migration(source_file, targets, content)
     else:
         # Generate and print plan
         plan = generate_migration_plan(source_file, targets)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test suite for the memory audit script.
+
+Tests memory file discovery using temporary project trees.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from audit import find_memory_files
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_find_memory_files_matches_rglob():
+    """Test: Rules discovery finds the same files as rglob('*.md')."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        rules = root / ".claude" / "rules"
+        (rules / "frontend").mkdir(parents=True)
+        (root / "CLAUDE.md").write_text("# Project\n")
+        (rules / "style.md").write_text("- Use tabs\n")
+        (rules / "frontend" / "react.md").write_text("- Use hooks\n")
+        (rules / "notes.txt").write_text("not a rule\n")
+
+        found = find_memory_files(root)
+        expected = {root / "CLAUDE.md", *rules.rglob("*.md")}
+
+        assert set(found) == expected, f"Expected {sorted(expected)}, got {sorted(found)}"
+        assert len(found) == len(expected), f"Duplicate paths found: {found}"
+    print(f"[PASS] Discovery: {len(found)} memory files")
+
+
+def test_find_memory_files_skips_symlinked_dirs():
+    """Test: A symlinked directory under rules/ is not followed (no loops/duplicates)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        rules = root / ".claude" / "rules"
+        rules.mkdir(parents=True)
+        (rules / "style.md").write_text("- Use tabs\n")
+        (root / ".claude" / "CLAUDE.md").write_text("# Project\n")
+        os.symlink("..", rules / "loop")
+
+        found = find_memory_files(root)
+        expected = {root / ".claude" / "CLAUDE.md", *rules.rglob("*.md")}
+
+        assert len(found) == 2, f"Symlinked directory was followed: {len(found)} paths"
+        assert set(found) == expected, f"Expected {sorted(expected)}, got {sorted(found)}"
+    print(f"[PASS] Symlinked dirs: {len(found)} memory files, loop not followed")
+
+
+def run_all_tests():
+    """Run all test cases."""
+    print("=" * 60)
+    print("Memory Audit Test Suite")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_find_memory_files_matches_rglob,
+        test_find_memory_files_skips_symlinked_dirs,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test.__name__}: {e}")
+            failed += 1
+
+    print()
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -16,13 +16,27 @@ Output: JSON with validation results
 """
 
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict
 
 
+# Directories never searched for memory files
+SKIP_DIRS = {".git", "node_modules", ".venv", "__pycache__"}
+
+# Matches @import("path") or @import('path') within a single line; it is run
+# over whole files, so none of its character classes may cross a newline
+IMPORT_RE = re.compile(r'@import[^\S\n]*\([^\S\n]*["\']([^"\'\n]+)["\'][^\S\n]*\)')
+
+# A frontmatter delimiter line: "---" with optional surrounding whitespace
+FRONTMATTER_CLOSE_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+
+
 class ValidationIssue(TypedDict):
     file: str
     line: int | None
@@ -42,22 +56,21 @@ def parse_frontmatter(content: str) -> tuple[dict[str, str | list[str]], int, in
     Returns (frontmatter_dict, start_line, end_line).
     Raises ValueError if frontmatter is invalid.
     """
-    lines = content.split("\n")
-
-    if not lines or lines[0].strip() != "---":
+    # Only the first line decides whether there is frontmatter at all
+    first_end = content.find("\n")
+    if first_end == -1:
+        first_end = len(content)
+    if content[:first_end].strip() != "---":
         return {}, 0, 0
 
-    end_index = -1
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_index = i
-            break
-
-    if end_index == -1:
+    close = FRONTMATTER_CLOSE_RE.search(content, first_end + 1)
+    if close is None:
         raise ValueError("Unclosed frontmatter: missing closing '---'")
+    end_index = content.count("\n", 0, close.start())
 
+    # Split only the block between the delimiters
     frontmatter: dict[str, str | list[str]] = {}
-    yaml_lines = lines[1:end_index]
+    yaml_lines = content[first_end + 1:close.start()].split("\n")
 
     for i, line in enumerate(yaml_lines):
         line_num = i + 2  # Account for first ---
@@ -93,22 +106,26 @@ def validate_glob_pattern(pattern: str) -> bool:
     if not pattern:
         return False
 
-    # Check for unbalanced brackets
+    # Check for invalid sequences
+    if "***" in pattern:
+        return False
+
+    # Check for unbalanced brackets; str.count does the common cases in C
+    open_count = pattern.count("[")
+    if open_count != pattern.count("]"):
+        return False
+    if open_count == 0:
+        return True
+
+    # Equal counts can still close before opening (e.g. "][")
     bracket_count = 0
     for char in pattern:
         if char == "[":
             bracket_count += 1
         elif char == "]":
             bracket_count -= 1
-        if bracket_count < 0:
-            return False
-
-    if bracket_count != 0:
-        return False
-
-    # Check for invalid sequences
-    if "***" in pattern:
-        return False
+            if bracket_count < 0:
+                return False
 
     return True
 
@@ -119,43 +136,86 @@ def find_imports(content: str) -> list[tuple[int, str]]:
     Returns list of (line_number, import_path).
     """
     imports: list[tuple[int, str]] = []
-    lines = content.split("\n")
 
-    for i, line in enumerate(lines):
-        # Match @import("path") or @import('path')
-        matches = re.findall(r'@import\s*\(\s*["\']([^"\']+)["\']\s*\)', line)
-        for match in matches:
-            imports.append((i + 1, match))
+    # One scan over the whole file; line numbers come from counting
+    # newlines between consecutive matches
+    line_num = 1
+    pos = 0
+    for match in IMPORT_RE.finditer(content):
+        line_num += content.count("\n", pos, match.start())
+        pos = match.start()
+        imports.append((line_num, match.group(1)))
 
     return imports
 
 
 def resolve_import_path(import_path: str, base_file: Path, project_root: Path) -> Path | None:
     """Resolve an import path relative to the base file or project root."""
+    return _resolve_import(import_path, base_file.parent, project_root)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_import(import_path: str, base_dir: Path, project_root: Path) -> Path | None:
+    """
+    Cached body of resolve_import_path, keyed by the importing directory so
+    sibling files sharing an import resolve it once. Existence checks are
+    plain os.path.exists calls. The cache is cleared at the start of each
+    run (validate_directory, or validate_file without a graph_cache), so
+    files created or deleted between runs are seen.
+    """
     # Try relative to base file first
-    relative_path = base_file.parent / import_path
-    if relative_path.exists():
+    relative_path = base_dir / import_path
+    if os.path.exists(relative_path):
         return relative_path.resolve()
 
     # Try relative to project root
     root_path = project_root / import_path
-    if root_path.exists():
+    if os.path.exists(root_path):
         return root_path.resolve()
 
     # Try with .md extension
     for path in [relative_path, root_path]:
         with_md = path.with_suffix(".md")
-        if with_md.exists():
+        if os.path.exists(with_md):
             return with_md.resolve()
 
     return None
 
 
+def read_imports(
+    file_path: Path,
+    project_root: Path,
+    graph_cache: dict[Path, tuple[Path, ...]]
+) -> tuple[Path, ...]:
+    """
+    Return the resolved paths file_path imports, reading it at most once.
+    graph_cache maps each file to its imports; missing or unreadable files
+    import nothing.
+    """
+    if file_path in graph_cache:
+        return graph_cache[file_path]
+
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except Exception:
+        graph_cache[file_path] = ()
+        return ()
+
+    resolved = (
+        resolve_import_path(import_path, file_path, project_root)
+        for _, import_path in find_imports(content)
+    )
+    graph_cache[file_path] = tuple(path for path in resolved if path)
+    return graph_cache[file_path]
+
+
 def check_import_depth(
     file_path: Path,
     project_root: Path,
     visited: set[Path] | None = None,
-    depth: int = 0
+    depth: int = 0,
+    *,
+    graph_cache: dict[Path, tuple[Path, ...]] | None = None
 ) -> tuple[int, list[Path]]:
     """
     Recursively check import depth.
@@ -163,6 +223,8 @@ def check_import_depth(
     """
     if visited is None:
         visited = set()
+    if graph_cache is None:
+        graph_cache = {}
 
     resolved_path = file_path.resolve()
 
@@ -170,37 +232,32 @@ def check_import_depth(
         # Circular import detected - return current depth
         return depth, [resolved_path]
 
+    # visited holds the current import chain: added on the way down and
+    # removed on the way back up, rather than copied for every child
     visited.add(resolved_path)
 
-    if not file_path.exists():
-        return depth, [resolved_path]
-
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except Exception:
-        return depth, [resolved_path]
-
-    imports = find_imports(content)
     max_depth = depth
     deepest_chain = [resolved_path]
 
-    for _, import_path in imports:
-        resolved_import = resolve_import_path(import_path, file_path, project_root)
-        if resolved_import:
-            sub_depth, sub_chain = check_import_depth(
-                resolved_import, project_root, visited.copy(), depth + 1
-            )
-            if sub_depth > max_depth:
-                max_depth = sub_depth
-                deepest_chain = [resolved_path] + sub_chain
+    for resolved_import in read_imports(file_path, project_root, graph_cache):
+        sub_depth, sub_chain = check_import_depth(
+            resolved_import, project_root, visited, depth + 1,
+            graph_cache=graph_cache
+        )
+        if sub_depth > max_depth:
+            max_depth = sub_depth
+            deepest_chain = [resolved_path] + sub_chain
 
+    visited.discard(resolved_path)
     return max_depth, deepest_chain
 
 
 def detect_circular_imports(
     file_path: Path,
     project_root: Path,
-    visited: list[Path] | None = None
+    visited: list[Path] | None = None,
+    *,
+    graph_cache: dict[Path, tuple[Path, ...]] | None = None
 ) -> list[Path] | None:
     """
     Detect circular imports starting from file_path.
@@ -208,60 +265,86 @@ def detect_circular_imports(
     """
     if visited is None:
         visited = []
+    if graph_cache is None:
+        graph_cache = {}
 
-    resolved_path = file_path.resolve()
+    # Files whose imports were fully explored without finding a cycle;
+    # reaching one again by another route cannot find one either
+    finished: set[Path] = set()
 
-    if resolved_path in visited:
-        # Found a cycle - return the path from the cycle start
-        cycle_start = visited.index(resolved_path)
-        return visited[cycle_start:] + [resolved_path]
+    def walk(path: Path) -> list[Path] | None:
+        resolved_path = path.resolve()
+
+        if resolved_path in visited:
+            # Found a cycle - return the path from the cycle start
+            cycle_start = visited.index(resolved_path)
+            return visited[cycle_start:] + [resolved_path]
 
-    visited.append(resolved_path)
+        if resolved_path in finished:
+            return None
 
-    if not file_path.exists():
+        visited.append(resolved_path)
+        for resolved_import in read_imports(path, project_root, graph_cache):
+            cycle = walk(resolved_import)
+            if cycle:
+                return cycle
+        visited.pop()
+        finished.add(resolved_path)
         return None
 
+    return walk(file_path)
+
+
+def read_file(file_path: Path) -> str | None:
+    """Read a file as UTF-8, or return None if it cannot be read."""
     try:
-        content = file_path.read_text(encoding="utf-8")
+        return file_path.read_text(encoding="utf-8")
     except Exception:
         return None
 
-    imports = find_imports(content)
-
-    for _, import_path in imports:
-        resolved_import = resolve_import_path(import_path, file_path, project_root)
-        if resolved_import:
-            cycle = detect_circular_imports(resolved_import, project_root, visited.copy())
-            if cycle:
-                return cycle
 
-    return None
+def validate_file(
+    file_path: Path,
+    project_root: Path,
+    *,
+    graph_cache: dict[Path, tuple[Path, ...]] | None = None,
+    content: str | None = None
+) -> ValidationResult:
+    """
+    Validate a single CLAUDE.md or rules file.
 
+    graph_cache is shared across calls so that each file in an import
+    graph is read once per run (see read_imports). content may be passed
+    when the file was already read; otherwise it is read here.
+    """
+    if graph_cache is None:
+        # A fresh run: drop import resolutions from any earlier run
+        _resolve_import.cache_clear()
+        graph_cache = {}
 
-def validate_file(file_path: Path, project_root: Path) -> ValidationResult:
-    """Validate a single CLAUDE.md or rules file."""
     errors: list[ValidationIssue] = []
     warnings: list[ValidationIssue] = []
 
-    if not file_path.exists():
-        errors.append({
-            "file": str(file_path),
-            "line": None,
-            "message": "File does not exist",
-            "severity": "error"
-        })
-        return {"valid": False, "errors": errors, "warnings": warnings}
+    if content is None:
+        if not file_path.exists():
+            errors.append({
+                "file": str(file_path),
+                "line": None,
+                "message": "File does not exist",
+                "severity": "error"
+            })
+            return {"valid": False, "errors": errors, "warnings": warnings}
 
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except Exception as e:
-        errors.append({
-            "file": str(file_path),
-            "line": None,
-            "message": f"Failed to read file: {e}",
-            "severity": "error"
-        })
-        return {"valid": False, "errors": errors, "warnings": warnings}
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except Exception as e:
+            errors.append({
+                "file": str(file_path),
+                "line": None,
+                "message": f"Failed to read file: {e}",
+                "severity": "error"
+            })
+            return {"valid": False, "errors": errors, "warnings": warnings}
 
     str_path = str(file_path)
 
@@ -292,20 +375,24 @@ def validate_file(file_path: Path, project_root: Path) -> ValidationResult:
                     "severity": "error"
                 })
 
-    # Check @import references
+    # Check @import references (the resolved ones seed the import graph)
     imports = find_imports(content)
+    resolved_imports: list[Path] = []
     for line_num, import_path in imports:
         resolved = resolve_import_path(import_path, file_path, project_root)
-        if not resolved:
+        if resolved:
+            resolved_imports.append(resolved)
+        else:
             errors.append({
                 "file": str_path,
                 "line": line_num,
                 "message": f"Import reference not found: '{import_path}'",
                 "severity": "error"
             })
+    graph_cache[file_path] = tuple(resolved_imports)
 
     # Check import depth
-    max_depth, chain = check_import_depth(file_path, project_root)
+    max_depth, chain = check_import_depth(file_path, project_root, graph_cache=graph_cache)
     if max_depth > 5:
         errors.append({
             "file": str_path,
@@ -322,7 +409,7 @@ def validate_file(file_path: Path, project_root: Path) -> ValidationResult:
         })
 
     # Detect circular imports
-    cycle = detect_circular_imports(file_path, project_root)
+    cycle = detect_circular_imports(file_path, project_root, graph_cache=graph_cache)
     if cycle:
         cycle_str = " -> ".join(p.name for p in cycle)
         errors.append({
@@ -341,6 +428,8 @@ def validate_file(file_path: Path, project_root: Path) -> ValidationResult:
 
 def validate_directory(dir_path: Path) -> ValidationResult:
     """Validate all memory/rules files in a directory."""
+    _resolve_import.cache_clear()
+
     all_errors: list[ValidationIssue] = []
     all_warnings: list[ValidationIssue] = []
 
@@ -357,28 +446,44 @@ def validate_directory(dir_path: Path) -> ValidationResult:
                 project_root = parent
                 break
 
-    # Find all relevant files
-    patterns = ["CLAUDE.md", "CLAUDE.local.md"]
-    files_to_check: list[Path] = []
-
-    # Check for CLAUDE.md files
-    for pattern in patterns:
-        files_to_check.extend(dir_path.rglob(pattern))
-
-    # Check for rules directory
+    # Rules directories whose *.md files are all checked
     rules_dir = dir_path / ".claude" / "rules" if (dir_path / ".claude").exists() else dir_path / "rules"
-    if rules_dir.exists():
-        files_to_check.extend(rules_dir.rglob("*.md"))
-
-    # Also check if dir_path itself is a .claude directory
+    rules_dirs = {str(rules_dir)}
     if dir_path.name == ".claude":
-        rules_in_claude = dir_path / "rules"
-        if rules_in_claude.exists():
-            files_to_check.extend(rules_in_claude.rglob("*.md"))
-
-    # Validate each file
+        rules_dirs.add(str(dir_path / "rules"))
+
+    # Find all relevant files in one walk, grouped as before: CLAUDE.md,
+    # then CLAUDE.local.md, then rules files
+    claude_files: list[Path] = []
+    local_files: list[Path] = []
+    rule_files: list[Path] = []
+
+    for root, dirs, files in os.walk(dir_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        in_rules = any(root == r or root.startswith(r + os.sep) for r in rules_dirs)
+        for name in files:
+            if name == "CLAUDE.md":
+                claude_files.append(Path(root, name))
+            elif name == "CLAUDE.local.md":
+                local_files.append(Path(root, name))
+            if in_rules and name.endswith(".md"):
+                rule_files.append(Path(root, name))
+
+    files_to_check = claude_files + local_files + rule_files
+
+    # Read all files, overlapping the I/O across a small thread pool.
+    # Unreadable files map to None and report their error in validate_file.
+    contents: dict[Path, str | None] = {}
+    if files_to_check:
+        with ThreadPoolExecutor(max_workers=min(8, len(files_to_check))) as executor:
+            contents = dict(zip(files_to_check, executor.map(read_file, files_to_check)))
+
+    # Validate each file, sharing one import graph across them
+    graph_cache: dict[Path, tuple[Path, ...]] = {}
     for file_path in files_to_check:
-        result = validate_file(file_path, project_root)
+        result = validate_file(
+            file_path, project_root, graph_cache=graph_cache, content=contents.get(file_path)
+        )
         all_errors.extend(result["errors"])
         all_warnings.extend(result["warnings"])
 
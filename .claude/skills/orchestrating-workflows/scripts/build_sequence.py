@@ -7,10 +7,17 @@ with parallel groupings where possible.
 """
 
 import json
+import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Tier metadata
@@ -53,6 +60,25 @@ TIER_DEFINITIONS = {
     },
 }
 
+# Metadata for tiers missing from TIER_DEFINITIONS ("name" is filled per tier)
+UNKNOWN_TIER_DEFINITION = {
+    "description": "Unknown tier",
+    "wait": True,
+    "parallel_within": True,
+}
+
+# Closing section of every orchestrator prompt
+EXECUTION_INSTRUCTIONS = (
+    "### Execution Instructions",
+    "",
+    "1. Execute each stage in order (Tier 0 → Tier 5)",
+    "2. Within each stage, run sequential agents first",
+    "3. Then spawn parallel agents simultaneously using multiple Task calls",
+    "4. Wait for all agents in a stage to complete before proceeding",
+    "5. Pass relevant outputs from earlier stages to later ones",
+    "6. Use available skills as needed for reference",
+)
+
 
 # Tier prerequisite requirements for pdocs validation
 TIER_DOC_REQUIREMENTS = {
@@ -67,6 +93,145 @@ TIER_DOC_REQUIREMENTS = {
 }
 
 
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed (bytes skip a decode step)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize obj with 2-space indentation, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def snapshot_feature_docs(feature_path: str) -> tuple:
+    """
+    Fingerprint the documents pdocs would check under feature_path.
+
+    Mirrors pdocs' own file discovery (.md/.yaml/.yml, skipping dot dirs
+    and node_modules) and returns sorted (path, mtime_ns, size) entries.
+    A directory's own mtime only changes when entries are added or
+    removed, so each document is stat'ed individually.
+    """
+    if os.path.isfile(feature_path):
+        st = os.stat(feature_path)
+        return ((feature_path, st.st_mtime_ns, st.st_size),)
+
+    entries = []
+    for root, dirs, files in os.walk(feature_path):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "node_modules"]
+        for name in files:
+            if name.endswith((".md", ".yaml", ".yml")):
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
+@lru_cache(maxsize=256)
+def _check_feature_docs_cached(
+    feature_path: str, cwd: str, snapshot: tuple
+) -> tuple[tuple[str, bool], ...]:
+    """
+    Run pdocs once over feature_path and report validity per document type.
+
+    pdocs auto-detects each document's type, so a single `check` call
+    covers every tier's requirements. A type maps to True only if all
+    documents of that type are valid; missing types are absent. cwd and
+    snapshot are unused here; they only key the cache (see
+    check_feature_docs).
+
+    Raises:
+        FileNotFoundError: pdocs (bunx) is not available
+        subprocess.TimeoutExpired: pdocs did not answer in time
+        subprocess.CalledProcessError: pdocs exited with an error
+        json.JSONDecodeError: pdocs output was not JSON
+    """
+    result = subprocess.run(
+        ["bunx", ".claude/pdocs", "check", feature_path, "--json"],
+        capture_output=True,
+        timeout=30,
+    )
+    result.check_returncode()
+
+    docs = loads_json(result.stdout)
+    if isinstance(docs, dict):
+        docs = [docs]
+
+    valid_by_type: dict[str, bool] = {}
+    for doc in docs:
+        doc_type = doc.get("type")
+        valid_by_type[doc_type] = valid_by_type.get(doc_type, True) and bool(doc.get("valid"))
+    return tuple(valid_by_type.items())
+
+
+def check_feature_docs(feature_path: str) -> dict[str, bool]:
+    """
+    Report validity per document type for feature_path, memoized in-process.
+
+    Results are keyed on the working directory and a snapshot of every
+    document's mtime and size, so repeated build_sequence calls skip the
+    pdocs subprocess until a document is added, removed or edited.
+    Failures (timeouts, pdocs errors) are never cached.
+    """
+    snapshot = snapshot_feature_docs(feature_path)
+    return dict(_check_feature_docs_cached(feature_path, os.getcwd(), snapshot))
+
+
+def validate_all_prerequisites(
+    tiers: Iterable[int],
+    feature_path: str,
+) -> dict[int, tuple[bool, str]]:
+    """
+    Validate the document prerequisites of several tiers with one pdocs call.
+
+    Args:
+        tiers: Tier numbers to validate
+        feature_path: Path to the feature directory
+
+    Returns:
+        Dict mapping each tier to (is_valid, error_message)
+    """
+    results = {tier: (True, "") for tier in tiers}
+    checked = [tier for tier in results if tier in TIER_DOC_REQUIREMENTS]
+    if not checked:
+        return results
+
+    def fail_all(message: str) -> dict[int, tuple[bool, str]]:
+        for tier in checked:
+            doc_type = TIER_DOC_REQUIREMENTS[tier]["required"][0]
+            results[tier] = (False, message.format(doc_type=doc_type))
+        return results
+
+    try:
+        valid_by_type = check_feature_docs(feature_path)
+    except subprocess.TimeoutExpired:
+        return fail_all("Timeout validating {doc_type} document")
+    except subprocess.CalledProcessError:
+        for tier in checked:
+            results[tier] = (False, TIER_DOC_REQUIREMENTS[tier]["message"])
+        return results
+    except json.JSONDecodeError:
+        return fail_all("Invalid response from pdocs for {doc_type}")
+    except FileNotFoundError:
+        # pdocs not available - skip validation
+        return results
+
+    for tier in checked:
+        requirements = TIER_DOC_REQUIREMENTS[tier]
+        if not all(valid_by_type.get(doc_type, False) for doc_type in requirements["required"]):
+            results[tier] = (False, requirements["message"])
+
+    return results
+
+
 def validate_tier_prerequisites(
     tier: int,
     feature_path: str,
@@ -81,45 +246,32 @@ def validate_tier_prerequisites(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if tier not in TIER_DOC_REQUIREMENTS:
-        return True, ""
-
-    requirements = TIER_DOC_REQUIREMENTS[tier]
-
-    for doc_type in requirements["required"]:
-        try:
-            result = subprocess.run(
-                [
-                    "bunx",
-                    ".claude/pdocs",
-                    "check",
-                    feature_path,
-                    "--type",
-                    doc_type,
-                    "--json",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+    return validate_all_prerequisites([tier], feature_path)[tier]
 
-            if result.returncode != 0:
-                return False, requirements["message"]
 
-            status = json.loads(result.stdout)
+def split_agents(agents: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Split agents into (parallel, sequential) lists in a single pass."""
+    parallel: list[dict] = []
+    sequential: list[dict] = []
+    for agent in agents:
+        (parallel if agent.get("parallel", True) else sequential).append(agent)
+    return parallel, sequential
 
-            if not status.get("valid"):
-                return False, requirements["message"]
 
-        except subprocess.TimeoutExpired:
-            return False, f"Timeout validating {doc_type} document"
-        except json.JSONDecodeError:
-            return False, f"Invalid response from pdocs for {doc_type}"
-        except FileNotFoundError:
-            # pdocs not available - skip validation
-            return True, ""
+def agent_summary(agent: dict) -> dict[str, Any]:
+    """
+    Project a matched agent onto the fields a stage reports.
 
-    return True, ""
+    A missing tiers list defaults to a shared empty tuple, which
+    serializes to the same JSON [] without allocating per agent.
+    """
+    return {
+        "name": agent["name"],
+        "path": agent["path"],
+        "category": agent.get("category", "general"),
+        "tiers": agent.get("tiers", ()),  # All tiers this agent belongs to
+        "match_score": agent.get("match_score", 0),
+    }
 
 
 def build_sequence(
@@ -145,83 +297,58 @@ def build_sequence(
 
     stages = []
     total_agents = 0
-    validation_results: dict[int, dict[str, Any]] = {}
+    all_valid = True
+    validation_errors: list[dict[str, Any]] = []
 
     # Determine feature path for validation
     effective_feature_path = feature_path or matched_result.get("project", ".")
 
-    # Build stages in tier order
-    for tier_num in sorted(int(t) for t in by_tier.keys()):
-        tier_key = str(tier_num)
-        agents = by_tier[tier_key]
+    # Split each non-empty tier into (parallel, sequential) agents up front
+    by_tier_split = {
+        int(tier_key): split_agents(agents)
+        for tier_key, agents in by_tier.items()
+        if agents
+    }
+
+    # Validate every tier's prerequisites with a single pdocs run
+    tier_results: dict[int, tuple[bool, str]] = {}
+    if not skip_validation:
+        tier_results = validate_all_prerequisites(by_tier_split, effective_feature_path)
 
-        if not agents:
-            continue
+    # Build stages in tier order
+    for tier_num in sorted(by_tier_split):
+        parallel_agents, sequential_agents = by_tier_split[tier_num]
 
-        tier_def = TIER_DEFINITIONS.get(tier_num, {
-            "name": f"Tier {tier_num}",
-            "description": "Unknown tier",
-            "wait": True,
-            "parallel_within": True,
-        })
+        tier_def = TIER_DEFINITIONS.get(tier_num)
+        if tier_def is None:
+            tier_def = {**UNKNOWN_TIER_DEFINITION, "name": f"Tier {tier_num}"}
 
-        # Validate tier prerequisites
+        # Tier prerequisite status; failures are collected as we go
         if skip_validation:
-            validation_results[tier_num] = {
-                "valid": True,
-                "skipped": True,
-                "message": "",
-            }
+            tier_validation = {"valid": True, "skipped": True, "message": ""}
         else:
-            is_valid, error_message = validate_tier_prerequisites(
-                tier_num,
-                effective_feature_path,
-            )
-            validation_results[tier_num] = {
+            is_valid, error_message = tier_results[tier_num]
+            tier_validation = {
                 "valid": is_valid,
                 "skipped": False,
                 "message": error_message,
             }
+            if not is_valid:
+                all_valid = False
+                validation_errors.append({"tier": tier_num, "message": error_message})
 
-        # Separate parallel and sequential agents
-        parallel_agents = [a for a in agents if a.get("parallel", True)]
-        sequential_agents = [a for a in agents if not a.get("parallel", True)]
-
-        tier_validation = validation_results[tier_num]
         stage = {
             "tier": tier_num,
             "name": tier_def["name"],
             "description": tier_def["description"],
             "wait_for_completion": tier_def["wait"],
-            "validation": {
-                "valid": tier_validation["valid"],
-                "skipped": tier_validation["skipped"],
-                "message": tier_validation["message"],
-            },
-            "parallel_agents": [
-                {
-                    "name": a["name"],
-                    "path": a["path"],
-                    "category": a.get("category", "general"),
-                    "tiers": a.get("tiers", []),  # All tiers this agent belongs to
-                    "match_score": a.get("match_score", 0),
-                }
-                for a in parallel_agents
-            ],
-            "sequential_agents": [
-                {
-                    "name": a["name"],
-                    "path": a["path"],
-                    "category": a.get("category", "general"),
-                    "tiers": a.get("tiers", []),  # All tiers this agent belongs to
-                    "match_score": a.get("match_score", 0),
-                }
-                for a in sequential_agents
-            ],
+            "validation": tier_validation,
+            "parallel_agents": list(map(agent_summary, parallel_agents)),
+            "sequential_agents": list(map(agent_summary, sequential_agents)),
         }
 
         stages.append(stage)
-        total_agents += len(agents)
+        total_agents += len(parallel_agents) + len(sequential_agents)
 
     # Add skills as references (not executed, but available)
     skill_references = [
@@ -233,17 +360,6 @@ def build_sequence(
         for name, skill in matched_skills.items()
     ]
 
-    # Compute overall validation status
-    all_valid = all(
-        validation_results.get(s["tier"], {}).get("valid", True)
-        for s in stages
-    )
-    validation_errors = [
-        {"tier": tier, "message": result["message"]}
-        for tier, result in validation_results.items()
-        if not result["valid"]
-    ]
-
     return {
         "project": matched_result.get("project"),
         "requirements_summary": matched_result.get("requirements_summary", ""),
@@ -319,37 +435,39 @@ def generate_task_prompt(
         "",
     ]
 
+    # Agent and skill lines are added in batches from generators
     for stage in stages:
-        prompt_parts.append(f"#### Stage {stage['tier']}: {stage['name']}")
-        prompt_parts.append(f"*{stage['description']}*")
-        prompt_parts.append("")
+        prompt_parts += (
+            f"#### Stage {stage['tier']}: {stage['name']}",
+            f"*{stage['description']}*",
+            "",
+        )
 
         if stage["sequential_agents"]:
             prompt_parts.append("**Sequential (run in order):**")
-            for agent in stage["sequential_agents"]:
-                prompt_parts.append(f"1. `{agent['name']}` - {agent['category']}")
+            prompt_parts.extend(
+                f"1. `{agent['name']}` - {agent['category']}"
+                for agent in stage["sequential_agents"]
+            )
             prompt_parts.append("")
 
         if stage["parallel_agents"]:
             prompt_parts.append("**Parallel (run simultaneously):**")
-            for agent in stage["parallel_agents"]:
-                prompt_parts.append(f"- `{agent['name']}` - {agent['category']}")
+            prompt_parts.extend(
+                f"- `{agent['name']}` - {agent['category']}"
+                for agent in stage["parallel_agents"]
+            )
             prompt_parts.append("")
 
     if sequence.get("available_skills"):
         prompt_parts.append("### Available Skills")
-        for skill in sequence["available_skills"]:
-            prompt_parts.append(f"- `{skill['name']}` ({skill['category']})")
+        prompt_parts.extend(
+            f"- `{skill['name']}` ({skill['category']})"
+            for skill in sequence["available_skills"]
+        )
         prompt_parts.append("")
 
-    prompt_parts.append("### Execution Instructions")
-    prompt_parts.append("")
-    prompt_parts.append("1. Execute each stage in order (Tier 0 → Tier 5)")
-    prompt_parts.append("2. Within each stage, run sequential agents first")
-    prompt_parts.append("3. Then spawn parallel agents simultaneously using multiple Task calls")
-    prompt_parts.append("4. Wait for all agents in a stage to complete before proceeding")
-    prompt_parts.append("5. Pass relevant outputs from earlier stages to later ones")
-    prompt_parts.append("6. Use available skills as needed for reference")
+    prompt_parts += EXECUTION_INSTRUCTIONS
 
     return "\n".join(prompt_parts)
 
@@ -375,11 +493,11 @@ def main():
 
     args = parser.parse_args()
 
-    # Load match results
+    # Load match results as raw bytes; the JSON parser decodes them itself
     if args.match_file:
-        match_result = json.loads(Path(args.match_file).read_text())
+        match_result = loads_json(Path(args.match_file).read_bytes())
     elif not sys.stdin.isatty():
-        match_result = json.loads(sys.stdin.read())
+        match_result = loads_json(sys.stdin.buffer.read())
     else:
         print("Error: Provide match results file or via stdin", file=sys.stderr)
         sys.exit(1)
@@ -395,7 +513,7 @@ def main():
         requirements = args.requirements or match_result.get("requirements_summary", "")
         print(generate_task_prompt(sequence, requirements))
     elif args.json:
-        print(json.dumps(sequence, indent=2))
+        print(dumps_json(sequence))
     else:
         print(f"Execution Plan for: {sequence.get('project', 'shared')}")
         print("=" * 60)